@@ -1,9 +1,9 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from tools.resume_parser import ResumeParseTool
-from crewai_tools import SerperDevTool
-from tools.web_search import DuckDuckGoSearchTool, TavilySearchTool
-from services.llm_service import LLMService
+from tools.web_search import DuckDuckGoSearchTool, TavilySearchTool, SerperSearchTool
+from tools.federated_search import FederatedSearchTool
+from services.llm_service import get_llm_service
 import os
 import yaml
 @CrewBase
@@ -21,8 +21,9 @@ class jobApplicationCrew():
         self.resume_parser = ResumeParseTool()
         self.search = DuckDuckGoSearchTool()
         self.tavily_search = TavilySearchTool()
-        self.search_tool = SerperDevTool()
-        self.llm = LLMService()
+        self.search_tool = SerperSearchTool()
+        self.federated_search = FederatedSearchTool()
+        self.llm = get_llm_service()
 
     @agent
     def ResumeAnalyzer(self) -> Agent:
@@ -43,7 +44,8 @@ class jobApplicationCrew():
         return Agent(
             config=self.agents_config['JobSearcher'],
             verbose=True,
-            tools=[self.tavily_search, self.search_tool, self.search]
+            # One concurrent call across Serper, Tavily and DuckDuckGo instead of three sequential ones
+            tools=[self.federated_search]
         )
 
     @task
@@ -0,0 +1,187 @@
+# bulk_ingest.py
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from config.config import LLM_MAX_CONCURRENCY
+
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt", ".json"}
+
+# One ResumeParseTool per extraction worker process.
+_worker_tool = None
+
+
+def _init_worker():
+    global _worker_tool
+    from tools.resume_parser import ResumeParseTool
+    _worker_tool = ResumeParseTool()
+
+
+def _extract_text(path):
+    """
+    Read one resume in a worker process, reusing the content-hash resume cache.
+
+    Returns:
+        dict: file, sha256, text, cached result (if any), extract_seconds, or error
+    """
+    started = time.perf_counter()
+    try:
+        digest, text, result = _worker_tool._load_cached(path)
+        return {
+            "file": path,
+            "sha256": digest,
+            "text": text,
+            "result": result,
+            "extract_seconds": round(time.perf_counter() - started, 4),
+        }
+    except Exception as e:
+        return {
+            "file": path,
+            "error": f"extraction failed: {e}",
+            "extract_seconds": round(time.perf_counter() - started, 4),
+        }
+
+
+def find_resumes(input_dir, recursive=True):
+    """Return supported resume files under `input_dir`, sorted for a stable order."""
+    pattern = "**/*" if recursive else "*"
+    return sorted(
+        str(path) for path in Path(input_dir).glob(pattern)
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+def load_completed(output_path):
+    """
+    Return the files already analyzed successfully in an existing JSONL output.
+    Files whose last record is an error are retried.
+    """
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial line from an interrupted run
+            if "error" in record:
+                completed.discard(record.get("file"))
+            else:
+                completed.add(record.get("file"))
+    return completed
+
+
+def bulk_ingest(input_dir, output_path, workers=None, concurrency=LLM_MAX_CONCURRENCY, recursive=True):
+    """
+    Analyze every resume under `input_dir`, appending one JSON line per resume to `output_path`.
+
+    Text extraction (CPU-bound) runs in a process pool of `workers` processes; LLM
+    extraction (I/O-bound) runs in a thread pool of `concurrency` resumes. `concurrency`
+    also sets the LLM service's process-wide request limit, which long resumes'
+    parallel section extractions share, so at most `concurrency` requests are in flight.
+    Records are written as soon as each resume finishes, so an interrupted run can be
+    resumed; files already present without an error are skipped.
+
+    Returns:
+        dict: Counts of processed, skipped and failed files
+    """
+    from tools.resume_parser import ResumeParseTool, is_complete_resume
+    from services.resume_cache import save_cached_resume
+    from services.llm_service import get_llm_service
+
+    files = find_resumes(input_dir, recursive=recursive)
+    completed = load_completed(output_path)
+    pending = [path for path in files if path not in completed]
+    stats = {"found": len(files), "skipped": len(files) - len(pending), "processed": 0, "failed": 0}
+    if not pending:
+        return stats
+
+    get_llm_service().set_max_concurrency(concurrency)
+    tool = ResumeParseTool()
+    write_lock = threading.Lock()
+
+    with open(output_path, "a", encoding="utf-8") as output:
+        def _write(record):
+            with write_lock:
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+                stats["failed" if "error" in record else "processed"] += 1
+                status = "error" if "error" in record else "ok"
+                print(f"[{stats['processed'] + stats['failed']}/{len(pending)}] {status} {record['file']}")
+
+        def _analyze(record):
+            started = time.perf_counter()
+            text = record.pop("text")
+            try:
+                result = tool._extract_information(text)
+            except Exception as e:
+                result = {"error": str(e)}
+            record["llm_seconds"] = round(time.perf_counter() - started, 4)
+            record["cached"] = False
+            if isinstance(result, dict) and "error" in result:
+                record["error"] = f"LLM extraction failed: {result['error']}"
+            else:
+                record["result"] = result
+                if is_complete_resume(result):
+                    save_cached_resume(record["sha256"], text, result)
+            _write(record)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as extractors, \
+                ThreadPoolExecutor(max_workers=max(1, concurrency)) as llm_pool:
+            llm_futures = []
+            for future in as_completed([extractors.submit(_extract_text, path) for path in pending]):
+                record = future.result()
+                if "error" in record:
+                    _write(record)
+                elif record["result"] is not None:
+                    record.pop("text")
+                    record["llm_seconds"] = 0.0
+                    record["cached"] = True
+                    _write(record)
+                else:
+                    llm_futures.append(llm_pool.submit(_analyze, record))
+            for future in llm_futures:
+                future.result()
+
+    return stats
+
+
+def main():
+    """Command-line entry point for bulk resume ingestion."""
+    parser = argparse.ArgumentParser(description="Analyze a directory of resumes into a JSONL file")
+    parser.add_argument("input_dir", help="Directory containing resumes (PDF, DOCX, TXT, JSON)")
+    parser.add_argument("--output", default="data/user_data/bulk_resumes.jsonl", help="JSONL output file")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument("--concurrency", type=int, default=LLM_MAX_CONCURRENCY,
+                        help="Maximum concurrent LLM requests")
+    parser.add_argument("--no-recursive", action="store_true", help="Only scan the top-level directory")
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input_dir):
+        print(f"Not a directory: {args.input_dir}")
+        sys.exit(1)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+
+    started = time.perf_counter()
+    stats = bulk_ingest(
+        args.input_dir,
+        args.output,
+        workers=args.workers,
+        concurrency=args.concurrency,
+        recursive=not args.no_recursive,
+    )
+    print(
+        f"\nDone in {time.perf_counter() - started:.1f}s: {stats['processed']} processed, "
+        f"{stats['failed']} failed, {stats['skipped']} skipped (of {stats['found']} found)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import streamlit as st
 from config.config import DEFAULT_LOCATION, SESSION_LOCATION, SESSION_JOB_TITLE
 from services.crew_service import execute_job_search
+from utils.job_dedup import dedupe_jobs
 import json
 import pandas as pd
 
@@ -85,12 +86,20 @@ def render_job_results():
         st.json(job_results)
         return
 
+    # Collapse tracking-URL variants and near-identical copies of the same posting
+    total = len(job_results)
+    job_results = dedupe_jobs(job_results)
+
     st.markdown("### 💼 Job Recommendations")
+    if total > len(job_results):
+        st.caption(f"{total - len(job_results)} duplicate postings hidden.")
 
     table_data = []
     for job in job_results:
         row = {}
         for key, value in job.items():
+            if key == "duplicates":
+                continue
             # Format URLs as clickable links
             if key.lower() == "url" and isinstance(value, str):
                 row["Apply Link"] = f'<a href="{value}" target="_blank">Apply Now</a>'
@@ -98,6 +107,8 @@ def render_job_results():
                 row["Match Score"] = f"{value * 100:.0f}%"
             elif isinstance(value, str):
                 row[key.title()] = value.strip()
+            elif isinstance(value, list):
+                row[key.replace("_", " ").title()] = ", ".join(str(item) for item in value)
             else:
                 row[key.title()] = value
         table_data.append(row)
@@ -128,5 +139,9 @@ def render_job_results():
             if match is not None:
                 st.markdown(f"**Match Score:** {match * 100:.0f}%")
             st.markdown(f"[Apply Now]({url})")
+            if job.get("matched_skills"):
+                st.markdown(f"**Skills you have:** {', '.join(job['matched_skills'])}")
+            if job.get("missing_skills"):
+                st.markdown(f"**Skills to build:** {', '.join(job['missing_skills'])}")
             st.markdown(f"**Snippet:** {snippet}")
             st.markdown("---")
@@ -69,34 +69,63 @@ def render_resume_analysis():
         for section, content in resume_data.items():
             if section in ["personal_info", "summary", "ats_score", "match_recommendations"]:
                 continue
+            _render_section(section, content)
 
-            st.markdown(f"### 📌 {section.replace('_', ' ').title()}")
-
-            if isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict):
-                        for key, value in item.items():
-                            if isinstance(value, list):
-                                st.markdown(f"**{key.replace('_', ' ').title()}:**")
-                                for val in value:
-                                    st.markdown(f"- {val}")
-                            else:
-                                st.markdown(f"**{key.replace('_', ' ').title()}:** {value}")
-                        st.markdown("---")  # Divider between items
-                    elif isinstance(item, str):
-                        st.markdown(f"- {item}")
-                    else:
-                        st.markdown(str(item))
+    with tabs[2]:  # Raw JSON
+        st.json(resume_data)
 
-            elif isinstance(content, dict):
-                for k, v in content.items():
-                    st.markdown(f"**{k.replace('_', ' ').title()}:** {v}")
 
-            elif isinstance(content, str):
-                st.markdown(content)
+def _render_section(section, content):
+    """Render a single resume section (list, dict, or plain text)."""
+    st.markdown(f"### 📌 {section.replace('_', ' ').title()}")
 
+    if isinstance(content, list):
+        for item in content:
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    if isinstance(value, list):
+                        st.markdown(f"**{key.replace('_', ' ').title()}:**")
+                        for val in value:
+                            st.markdown(f"- {val}")
+                    else:
+                        st.markdown(f"**{key.replace('_', ' ').title()}:** {value}")
+                st.markdown("---")  # Divider between items
+            elif isinstance(item, str):
+                st.markdown(f"- {item}")
             else:
-                st.write(content)
+                st.markdown(str(item))
 
-    with tabs[2]:  # Raw JSON
-        st.json(resume_data)
+    elif isinstance(content, dict):
+        for k, v in content.items():
+            st.markdown(f"**{k.replace('_', ' ').title()}:** {v}")
+
+    elif isinstance(content, str):
+        st.markdown(content)
+
+    else:
+        st.write(content)
+
+
+def render_analysis_stream(section_stream):
+    """
+    Render resume sections progressively as a streaming extraction produces them.
+
+    Args:
+        section_stream (iterable): (section_name, value) pairs, e.g. from ResumeParseTool._stream_from_resume
+
+    Returns:
+        dict: The assembled resume data
+    """
+    st.markdown("### 📄 Resume Analysis")
+    resume_data = {}
+    placeholders = {}
+    for section, content in section_stream:
+        resume_data[section] = content
+        if section == "error":
+            st.error(content)
+        elif section != "raw_response":
+            # A section can arrive more than once (e.g. contact info first, then the full personal info)
+            placeholder = placeholders.setdefault(section, st.empty())
+            with placeholder.container():
+                _render_section(section, content)
+    return resume_data
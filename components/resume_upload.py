@@ -1,19 +1,22 @@
 import streamlit as st
 import os
 import tempfile
-from config.config import ALLOWED_EXTENSIONS, MAX_FILE_SIZE
+from config.config import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, PERSIST_UPLOADS
 from utils.file_handlers import save_uploaded_file
 from tools.resume_parser import ResumeParseTool
+from components.resume_analysis import render_analysis_stream
 
 def render_resume_upload():
     """Render the resume upload component."""
     st.markdown("### Upload Your Resume")
     
     col1, col2 = st.columns([3, 1])
+    # Full-width area below the uploader for progressively rendered sections
+    stream_area = st.container()
     
     with col1:
         uploaded_file = st.file_uploader(
-            "Upload your resume (PDF, DOCX, or TXT)",
+            "Upload your resume (PDF, DOCX, TXT, or JSON Resume)",
             type=ALLOWED_EXTENSIONS,
             key="resume_uploader"
         )
@@ -24,14 +27,18 @@ def render_resume_upload():
             if uploaded_file.size > MAX_FILE_SIZE:
                 st.error(f"File size exceeds the maximum limit of {MAX_FILE_SIZE/1024/1024}MB")
             else:
-                # Save the file
-                file_path = save_uploaded_file(uploaded_file)
+                # Parse straight from memory; only keep a copy on disk if configured to
+                file_path = save_uploaded_file(uploaded_file) if PERSIST_UPLOADS else uploaded_file.name
                 
                 # Parse the resume
                 if st.button("Analyze Resume", type="primary"):
                     with st.spinner("Analyzing your resume..."):
                         resume_parser = ResumeParseTool()
-                        result = resume_parser._run({"resume_path": file_path})
+                        # Render sections as soon as the LLM finishes each one
+                        with stream_area:
+                            result = render_analysis_stream(
+                                resume_parser._stream_from_resume(data=uploaded_file.getvalue())
+                            )
                         
                         # Store in session state
                         st.session_state.resume_path = file_path
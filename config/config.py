@@ -15,8 +15,9 @@ SERPER_API_KEY = os.getenv("SERPER_API_KEY", "")
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "")
 
 # File upload settings
-ALLOWED_EXTENSIONS = ["pdf", "docx", "txt"]
+ALLOWED_EXTENSIONS = ["pdf", "docx", "txt", "json"]
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+PERSIST_UPLOADS = os.getenv("PERSIST_UPLOADS", "false").lower() in ("1", "true", "yes")  # keep a copy of uploads on disk
 
 # Session state keys
 SESSION_RESUME_DATA = "resume_data"
@@ -28,4 +29,79 @@ SESSION_LOCATION = "location"
 SESSION_JOB_TITLE = "job_title"
 
 # Default values
-DEFAULT_LOCATION = "Remote"
\ No newline at end of file
+DEFAULT_LOCATION = "Remote"
+
+# LLM response cache settings
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "data/cache/llm_responses")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))  # 7 days
+LLM_CACHE_MAX_MEMORY_ITEMS = int(os.getenv("LLM_CACHE_MAX_MEMORY_ITEMS", "256"))
+LLM_CACHE_MAX_DISK_ITEMS = int(os.getenv("LLM_CACHE_MAX_DISK_ITEMS", "2048"))
+
+# Maximum number of LLM requests issued in parallel by batch helpers
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+
+# Embedding cache settings
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "data/cache/embeddings")
+
+# Gemini embedding HTTP transport settings
+GEMINI_EMBEDDING_CONNECT_TIMEOUT = float(os.getenv("GEMINI_EMBEDDING_CONNECT_TIMEOUT", "5"))
+GEMINI_EMBEDDING_READ_TIMEOUT = float(os.getenv("GEMINI_EMBEDDING_READ_TIMEOUT", "30"))
+GEMINI_EMBEDDING_MAX_RETRIES = int(os.getenv("GEMINI_EMBEDDING_MAX_RETRIES", "3"))
+GEMINI_EMBEDDING_POOL_SIZE = int(os.getenv("GEMINI_EMBEDDING_POOL_SIZE", "10"))
+
+# Provider record/replay settings
+PROVIDER_MODE = os.getenv("PROVIDER_MODE", "live")  # live | record | replay
+PROVIDER_FIXTURE_DIR = os.getenv("PROVIDER_FIXTURE_DIR", "data/fixtures")
+PROVIDER_REPLAY_LATENCY = os.getenv("PROVIDER_REPLAY_LATENCY", "0")  # milliseconds, or "recorded"
+
+# PDF extraction limits
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "50"))
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "100000"))
+PDF_EXTRACT_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", "30"))  # seconds, whole document
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+PDF_MAX_WORKERS = int(os.getenv("PDF_MAX_WORKERS", "0")) or None  # None = CPU count
+
+# Long resumes are split by section and extracted with parallel LLM calls
+RESUME_CHUNKED_EXTRACTION = os.getenv("RESUME_CHUNKED_EXTRACTION", "true").lower() in ("1", "true", "yes")
+RESUME_CHUNK_MIN_CHARS = int(os.getenv("RESUME_CHUNK_MIN_CHARS", "6000"))
+
+# Federated web search (all providers queried concurrently)
+SEARCH_PROVIDERS = [p.strip() for p in os.getenv("SEARCH_PROVIDERS", "serper,tavily,duckduckgo").split(",") if p.strip()]
+SEARCH_QUORUM = int(os.getenv("SEARCH_QUORUM", "2"))  # providers with results needed before returning early
+SEARCH_DEADLINE = float(os.getenv("SEARCH_DEADLINE", "8"))  # seconds
+SEARCH_HEDGE_PERCENTILE = float(os.getenv("SEARCH_HEDGE_PERCENTILE", "0.9"))
+SEARCH_HEDGE_DELAY = float(os.getenv("SEARCH_HEDGE_DELAY", "2.5"))  # seconds, used until enough latencies are observed
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "20"))
+
+# Search result cache
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+SEARCH_CACHE_TTLS = {  # seconds per provider, e.g. "serper=21600,tavily=21600,duckduckgo=3600"
+    name.strip(): int(ttl)
+    for name, ttl in (
+        item.split("=", 1)
+        for item in os.getenv("SEARCH_CACHE_TTLS", "serper=21600,tavily=21600,duckduckgo=3600").split(",")
+        if "=" in item
+    )
+}
+SEARCH_CACHE_DEFAULT_TTL = int(os.getenv("SEARCH_CACHE_DEFAULT_TTL", "3600"))
+SEARCH_CACHE_STALE_TTL = int(os.getenv("SEARCH_CACHE_STALE_TTL", str(24 * 3600)))  # serve stale while refreshing
+SEARCH_CACHE_MAX_ITEMS = int(os.getenv("SEARCH_CACHE_MAX_ITEMS", "1000"))
+
+# Local job listing index (BM25 over data/user_data/job_listings)
+JOB_INDEX_FIELD_BOOSTS = {"title": 3.0, "company": 2.0, "snippet": 1.0}
+JOB_INDEX_K1 = float(os.getenv("JOB_INDEX_K1", "1.2"))
+JOB_INDEX_B = float(os.getenv("JOB_INDEX_B", "0.75"))
+
+# Job vector index (embedding-based resume/job matching)
+JOB_VECTOR_DIR = os.getenv("JOB_VECTOR_DIR", "data/cache/job_vectors")
+JOB_VECTOR_MODE = os.getenv("JOB_VECTOR_MODE", "auto")  # exact | ivf | auto (ivf from JOB_VECTOR_IVF_MIN_JOBS)
+JOB_VECTOR_IVF_MIN_JOBS = int(os.getenv("JOB_VECTOR_IVF_MIN_JOBS", "50000"))
+JOB_VECTOR_NPROBE = int(os.getenv("JOB_VECTOR_NPROBE", "8"))
+
+# Job search pipeline
+JOB_SEARCH_MODE = os.getenv("JOB_SEARCH_MODE", "agent")  # agent (CrewAI JobSearcher) | direct (no agent loop)
+JOB_SEARCH_LLM_RERANK = os.getenv("JOB_SEARCH_LLM_RERANK", "false").lower() in ("1", "true", "yes")
+JOB_SEARCH_MAX_RESULTS = int(os.getenv("JOB_SEARCH_MAX_RESULTS", "15"))
+JOB_SEARCH_LOCAL_RESULTS = int(os.getenv("JOB_SEARCH_LOCAL_RESULTS", "10"))  # stored listings mixed into results
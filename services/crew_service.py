@@ -1,13 +1,10 @@
 import os
-import json
 from agents.job_application_crew import jobApplicationCrew
 from crewai import Crew, Process
-from services.llm_service import LLMService
-import re
 import traceback
-import ast
-
-llm = LLMService()
+from utils.json_decoder import decode_llm_json, LLMJSONDecodeError
+from services.job_pipeline import finalize_jobs, run_direct_job_search
+from config.config import JOB_SEARCH_MODE
 
 def execute_resume_analysis(resume_data):
     """
@@ -36,15 +33,31 @@ def execute_resume_analysis(resume_data):
         
         # Try to parse the result as JSON
         try:
-            return json.loads(result)
-        except:
+            return decode_llm_json(str(result), task="analyze_resume")
+        except LLMJSONDecodeError:
             return result
     except Exception as e:
         return f"Error analyzing resume: {str(e)}"
 
 
-def execute_job_search(resume_data, job_title="", location="Remote"):
+def execute_job_search(resume_data, job_title="", location="Remote", mode=None):
+    """
+    Execute the job search task.
+
+    Args:
+        resume_data (dict | str): Parsed resume
+        job_title (str): Job title or keywords
+        location (str): Job location
+        mode (str, optional): "agent" (CrewAI JobSearcher) or "direct" (no agent loop);
+            defaults to JOB_SEARCH_MODE
+
+    Returns:
+        list | str: Job dicts, or the raw agent output if it could not be decoded
+    """
     try:
+        if (mode or JOB_SEARCH_MODE) == "direct":
+            return run_direct_job_search(resume_data, job_title=job_title, location=location)
+
         crew_base = jobApplicationCrew()
 
         crew = Crew(
@@ -63,16 +76,17 @@ def execute_job_search(resume_data, job_title="", location="Remote"):
         )
 
         output_text = str(result.output) if hasattr(result, "output") else str(result)
-        cleaned = re.sub(r"^```(?:json)?\s*|\s*```$", "", output_text.strip(), flags=re.DOTALL)
 
-        print("Raw cleaned output:", repr(cleaned))  # 🔍 Check what's wrong
-
-        # First try JSON
+        # Salvage JSON from fenced, truncated or Python-style output instead of failing the run
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            # Then fallback to Python dict-style strings
-            return ast.literal_eval(cleaned)
+            jobs = decode_llm_json(output_text, task="search_jobs")
+        except LLMJSONDecodeError as e:
+            print(f"Could not decode search_jobs output: {e}")
+            return output_text
+
+        # De-duplicate, replace the LLM's guessed match scores with local scoring,
+        # attach skill gaps and store the jobs for the local index
+        return finalize_jobs(resume_data, jobs)
 
     except Exception as e:
         full_traceback = traceback.format_exc()  # 👈 Full error with stack trace
@@ -118,16 +132,13 @@ def execute_resume_improvement(resume_data, job_results=None, job_title="", loca
         result = crew.kickoff(inputs=inputs)
         
         output_text = str(result.output) if hasattr(result, "output") else str(result)
-        cleaned = re.sub(r"^```(?:json)?\s*|\s*```$", "", output_text.strip(), flags=re.DOTALL)
-
-        print("Raw cleaned output:", repr(cleaned))  # 🔍 Check what's wrong
 
-        # First try JSON
+        # Salvage JSON from fenced, truncated or Python-style output instead of failing the run
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            # Then fallback to Python dict-style strings
-            return ast.literal_eval(cleaned)
+            return decode_llm_json(output_text, task="improve_resume")
+        except LLMJSONDecodeError as e:
+            print(f"Could not decode improve_resume output: {e}")
+            return output_text
 
     except Exception as e:
         full_traceback = traceback.format_exc()  # 👈 Full error with stack trace
@@ -0,0 +1,185 @@
+# services/embedding_cache.py
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Disk-backed embedding cache stored as an append-only, memory-mapped float32 matrix.
+
+    Layout inside `cache_dir`:
+        vectors.f32  raw row-major float32 vectors, one row per cached text
+        index.txt    JSON header line ({"model_id", "dim"}) followed by one text hash per row
+
+    Row i of the matrix belongs to the i-th hash line, so the index never stores offsets.
+    Vectors are read through np.memmap, so the corpus is never loaded into RAM as a whole.
+    """
+
+    VECTOR_FILE = "vectors.f32"
+    INDEX_FILE = "index.txt"
+
+    def __init__(self, cache_dir="data/cache/embeddings", model_id="", dim=None):
+        """
+        Args:
+            cache_dir (str): Directory holding the vector and index files
+            model_id (str): Identifier of the embedding model; a different id than the one
+                on disk compacts (discards) the stored vectors
+            dim (int, optional): Embedding dimension, inferred from the first batch if omitted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.vector_path = self.cache_dir / self.VECTOR_FILE
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        self.model_id = model_id
+        self.dim = dim
+
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._vectors = None
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def key(self, text):
+        """Return the cache key for `text` under the current model."""
+        return hashlib.sha256(f"{self.model_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, text):
+        """
+        Return the cached vector for `text` as a zero-copy memmap view, or None.
+        """
+        with self._lock:
+            row = self._rows.get(self.key(text))
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._vectors[row]
+
+    def get_many(self, texts, embed_fn, batch_size=64):
+        """
+        Return embeddings for `texts`, computing only the ones not cached yet.
+
+        Args:
+            texts (list[str]): Texts to embed
+            embed_fn (callable): Takes a list of texts and returns an (n, dim) array
+            batch_size (int): Number of missing texts passed to `embed_fn` at once
+
+        Returns:
+            np.ndarray: (len(texts), dim) float32 matrix in input order
+        """
+        texts = list(texts)
+        keys = [self.key(text) for text in texts]
+
+        with self._lock:
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key not in self._rows and key not in missing:
+                    missing[key] = text
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+            missing_keys = list(missing)
+            for start in range(0, len(missing_keys), batch_size):
+                batch_keys = missing_keys[start:start + batch_size]
+                vectors = embed_fn([missing[k] for k in batch_keys])
+                self._append(batch_keys, vectors)
+
+            if not texts:
+                return np.zeros((0, self.dim or 0), dtype=np.float32)
+            return np.asarray(self._vectors[[self._rows[k] for k in keys]])
+
+    def compact(self, model_id=None):
+        """
+        Drop all stored vectors, e.g. after switching embedding models.
+
+        Args:
+            model_id (str, optional): New model id to record in the header
+        """
+        with self._lock:
+            if model_id is not None:
+                self.model_id = model_id
+            self._reset()
+
+    def _load(self):
+        if not (self.index_path.exists() and self.vector_path.exists()):
+            self._reset()
+            return
+
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                header = {}
+            hashes = [line.strip() for line in f if line.strip()]
+
+        if header.get("model_id") != self.model_id or (self.dim and header.get("dim") != self.dim):
+            print("Embedding model changed; compacting embedding cache.")
+            self._reset()
+            return
+
+        self.dim = header.get("dim")
+        if not self.dim:
+            self._reset()
+            return
+
+        # A crash between the vector and index appends can leave them out of step; keep the common prefix.
+        row_bytes = self.dim * np.dtype(np.float32).itemsize
+        n = min(len(hashes), os.path.getsize(self.vector_path) // row_bytes)
+        if n != len(hashes) or n * row_bytes != os.path.getsize(self.vector_path):
+            with open(self.vector_path, "r+b") as f:
+                f.truncate(n * row_bytes)
+            hashes = hashes[:n]
+            self._write_index(hashes)
+
+        self._rows = {h: i for i, h in enumerate(hashes)}
+        self._remap()
+
+    def _reset(self):
+        self._rows = {}
+        open(self.vector_path, "wb").close()
+        self._write_index([])
+        self._remap()
+
+    def _write_index(self, hashes):
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"model_id": self.model_id, "dim": self.dim}) + "\n")
+            for h in hashes:
+                f.write(h + "\n")
+
+    def _append(self, keys, vectors):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[0] != len(keys):
+            raise ValueError("embed_fn must return one row per input text")
+
+        if not self.dim:
+            self.dim = vectors.shape[1]
+            self._write_index([])
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected embeddings of dim {self.dim}, got {vectors.shape[1]}")
+
+        with open(self.vector_path, "ab") as f:
+            f.write(vectors.tobytes())
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for key in keys:
+                f.write(key + "\n")
+
+        start = len(self._rows)
+        for offset, key in enumerate(keys):
+            self._rows[key] = start + offset
+        self._remap()
+
+    def _remap(self):
+        n = len(self._rows)
+        if n and self.dim:
+            self._vectors = np.memmap(self.vector_path, dtype=np.float32, mode="r", shape=(n, self.dim))
+        else:
+            self._vectors = np.zeros((0, self.dim or 0), dtype=np.float32)
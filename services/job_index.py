@@ -0,0 +1,264 @@
+# services/job_index.py
+import os
+import re
+import json
+import math
+import heapq
+import hashlib
+import threading
+from collections import Counter
+
+from data.data_manager import DataManager
+from services.search_cache import normalize_terms
+from utils.job_dedup import canonical_url
+from config.config import JOB_INDEX_FIELD_BOOSTS, JOB_INDEX_K1, JOB_INDEX_B
+
+INDEX_VERSION = 1
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = {"a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "with", "is", "are", "we", "you"}
+
+
+def tokenize(text):
+    """Lower-case word tokens of `text`, without stopwords."""
+    return [token for token in _TOKEN_RE.findall(str(text or "").lower()) if token not in _STOPWORDS]
+
+
+def job_listing_id(job):
+    """Stable listing id for a job: a hash of its canonical URL, or of title+company without one."""
+    key = canonical_url(job.get("url")) or f"{job.get('title', '')}|{job.get('company', '')}".lower()
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class JobIndex:
+    """
+    BM25F inverted index over the job listings DataManager stores in
+    data/user_data/job_listings (one JSON file per job).
+
+    Title, company and snippet are indexed as separate fields with their own length
+    normalization and JOB_INDEX_FIELD_BOOSTS weights. refresh() applies only what changed
+    on disk since the last call (by file mtime), and the per-document term counts are
+    persisted under DataManager's cache directory so a restart does not re-read every listing.
+    """
+
+    def __init__(self, base_dir="data", field_boosts=None, k1=JOB_INDEX_K1, b=JOB_INDEX_B):
+        """
+        Args:
+            base_dir (str): DataManager base directory
+            field_boosts (dict, optional): field -> weight; defaults to JOB_INDEX_FIELD_BOOSTS
+            k1 (float): BM25 term-frequency saturation
+            b (float): BM25 length normalization
+        """
+        data_manager = DataManager(base_dir)
+        self.listing_dir = data_manager.base_dir / "user_data" / "job_listings"
+        self.index_path = data_manager.base_dir / "cache" / "job_index.json"
+        self.field_boosts = dict(field_boosts or JOB_INDEX_FIELD_BOOSTS)
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.RLock()
+        self.docs = {}       # doc_id -> {"mtime", "job", "tf": {field: {term: count}}, "len": {field: n}}
+        self.postings = {}   # term -> set of doc_ids
+        self._field_totals = Counter()
+        self._load()
+
+    # ----- persistence -------------------------------------------------
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if stored.get("version") != INDEX_VERSION or stored.get("fields") != sorted(self.field_boosts):
+            return
+        for doc_id, doc in stored.get("docs", {}).items():
+            self._add_doc(doc_id, doc)
+
+    def save(self):
+        """Persist the indexed documents so the next process starts incrementally."""
+        with self._lock:
+            payload = {"version": INDEX_VERSION, "fields": sorted(self.field_boosts), "docs": self.docs}
+            tmp_path = f"{self.index_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self.index_path)
+            except (OSError, TypeError) as e:
+                print("Error writing job index:", e)
+
+    # ----- incremental updates -----------------------------------------
+
+    def _add_doc(self, doc_id, doc):
+        self.docs[doc_id] = doc
+        for field, length in doc["len"].items():
+            self._field_totals[field] += length
+        for terms in doc["tf"].values():
+            for term in terms:
+                self.postings.setdefault(term, set()).add(doc_id)
+
+    def add(self, doc_id, job, mtime=0.0):
+        """Index (or re-index) one job listing."""
+        tf = {field: dict(Counter(tokenize(job.get(field)))) for field in self.field_boosts}
+        doc = {
+            "mtime": mtime,
+            "job": job,
+            "tf": tf,
+            "len": {field: sum(counts.values()) for field, counts in tf.items()},
+        }
+        with self._lock:
+            self.remove(doc_id)
+            self._add_doc(doc_id, doc)
+
+    def remove(self, doc_id):
+        """Drop one listing from the index; unknown ids are ignored."""
+        with self._lock:
+            doc = self.docs.pop(doc_id, None)
+            if doc is None:
+                return
+            for field, length in doc["len"].items():
+                self._field_totals[field] -= length
+            for terms in doc["tf"].values():
+                for term in terms:
+                    holders = self.postings.get(term)
+                    if holders is not None:
+                        holders.discard(doc_id)
+                        if not holders:
+                            del self.postings[term]
+
+    def refresh(self):
+        """
+        Sync the index with the listing directory: new or modified files are (re)indexed,
+        deleted ones removed. Unchanged files are not opened.
+
+        Returns:
+            dict: Counts of added, updated and removed listings
+        """
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            seen = set()
+            for entry in os.scandir(self.listing_dir):
+                if not entry.name.endswith(".json"):
+                    continue
+                doc_id = entry.name[:-5]
+                seen.add(doc_id)
+                mtime = entry.stat().st_mtime
+                known = self.docs.get(doc_id)
+                if known is not None and known["mtime"] == mtime:
+                    continue
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        job = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Skipping unreadable job listing {entry.name}: {e}")
+                    continue
+                if not isinstance(job, dict):
+                    continue
+                self.add(doc_id, job, mtime=mtime)
+                changes["updated" if known is not None else "added"] += 1
+            for doc_id in set(self.docs) - seen:
+                self.remove(doc_id)
+                changes["removed"] += 1
+            if any(changes.values()):
+                self.save()
+        return changes
+
+    # ----- querying ----------------------------------------------------
+
+    def _matches_location(self, job, location_tokens):
+        text = " ".join(str(job.get(field) or "") for field in ("title", "snippet"))
+        tokens = set(normalize_terms(text).split()) | set(normalize_terms(job.get("location") or "", location=True).split())
+        return location_tokens <= tokens
+
+    def search(self, query, k=10, location=None):
+        """
+        Rank stored listings against `query` with BM25F.
+
+        Args:
+            query (str): Free-text query, e.g. "python developer"
+            k (int): Number of results to return
+            location (str, optional): Keep only jobs whose location/title/snippet mention it
+                (location aliases such as "NYC" or "WFH" are normalized)
+
+        Returns:
+            list: Up to `k` job dicts, best first, each with a "bm25_score" and "listing_id"
+        """
+        terms = set(tokenize(query))
+        location_tokens = set(normalize_terms(location, location=True).split()) if location else None
+        with self._lock:
+            n_docs = len(self.docs)
+            if not terms or not n_docs:
+                return []
+            avg_len = {
+                field: (self._field_totals[field] / n_docs) or 1.0 for field in self.field_boosts
+            }
+            idf = {}
+            candidates = set()
+            for term in terms:
+                holders = self.postings.get(term)
+                if holders:
+                    idf[term] = math.log(1 + (n_docs - len(holders) + 0.5) / (len(holders) + 0.5))
+                    candidates |= holders
+
+            scored = []
+            for doc_id in candidates:
+                doc = self.docs[doc_id]
+                if location_tokens and not self._matches_location(doc["job"], location_tokens):
+                    continue
+                score = 0.0
+                for term, term_idf in idf.items():
+                    # BM25F: boost- and length-normalized term frequency summed over fields
+                    weighted_tf = 0.0
+                    for field, boost in self.field_boosts.items():
+                        count = doc["tf"][field].get(term)
+                        if count:
+                            norm = 1 - self.b + self.b * doc["len"][field] / avg_len[field]
+                            weighted_tf += boost * count / norm
+                    if weighted_tf:
+                        score += term_idf * weighted_tf / (self.k1 + weighted_tf)
+                scored.append((score, doc_id))
+
+            top = heapq.nlargest(k, scored)
+            return [
+                dict(self.docs[doc_id]["job"], bm25_score=round(score, 4), listing_id=doc_id)
+                for score, doc_id in top
+            ]
+
+    def __len__(self):
+        return len(self.docs)
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_job_index():
+    """Return the process-wide JobIndex, refreshed against the listing directory."""
+    global _shared_index
+    if _shared_index is None:
+        with _shared_index_lock:
+            if _shared_index is None:
+                _shared_index = JobIndex()
+    _shared_index.refresh()
+    return _shared_index
+
+
+def save_job_listings(jobs):
+    """
+    Store searched jobs through DataManager so later searches can be answered locally.
+    Listing ids are derived from the canonical URL, so re-finding a job overwrites it.
+
+    Returns:
+        list: Listing ids, in input order
+    """
+    data_manager = DataManager()
+    ids = []
+    for job in jobs:
+        if not isinstance(job, dict):
+            continue
+        listing = dict(job, id=job_listing_id(job))
+        try:
+            job_id, _ = data_manager.save_job_listing(listing)
+            ids.append(job_id)
+        except (OSError, TypeError) as e:
+            print("Error saving job listing:", e)
+    return ids
@@ -0,0 +1,298 @@
+# services/job_pipeline.py
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from services.job_index import get_job_index, save_job_listings
+from services.job_vectors import get_job_vector_index
+from services.llm_service import get_llm_service
+from tools.federated_search import get_federated_search
+from tools.skill_matcher import annotate_jobs, get_skill_matcher
+from utils.job_dedup import dedupe_jobs
+from utils.json_decoder import decode_llm_json
+from config.config import JOB_SEARCH_LLM_RERANK, JOB_SEARCH_MAX_RESULTS, JOB_SEARCH_LOCAL_RESULTS
+
+# Job boards whose host says nothing about the employer
+JOB_BOARDS = {
+    "linkedin", "indeed", "glassdoor", "naukri", "monster", "ziprecruiter", "wellfound", "angel",
+    "greenhouse", "lever", "workable", "smartrecruiters", "myworkdayjobs", "simplyhired",
+    "dice", "foundit", "instahyre", "remoteok", "weworkremotely", "builtin",
+}
+_SITE_SUFFIX_RE = re.compile(
+    r"\s*[|\-–—]\s*(?:linkedin|indeed(?:\.com)?|glassdoor|naukri(?:\.com)?|monster|ziprecruiter|"
+    r"wellfound|simplyhired|dice|careers?|jobs?)\b.*$",
+    re.IGNORECASE,
+)
+# Search-result and listing pages ("Python Developer Jobs in Pune - 2,345 openings", "500+ React jobs")
+_LISTING_TITLE_RE = re.compile(
+    r"\b\d[\d,]*\+?\s+(?:[\w.+#-]+\s+){0,5}?(?:jobs|openings|vacancies)\b"
+    r"|\b(?:jobs|openings|vacancies)\b(?:,\s*employment)?\s+(?:in|near|for)\b"
+    r"|\b(?:jobs|openings|vacancies)\s*$",
+    re.IGNORECASE,
+)
+_LISTING_URL_RE = re.compile(
+    r"/jobs/search|/q-|[a-z0-9]-jobs(?:[-./]|$)|[?&](?:q|query|keywords?)=",
+    re.IGNORECASE,
+)
+# Words that name a place or work mode rather than an employer ("Front-end Developer - Remote")
+LOCATION_WORDS = {
+    "remote", "hybrid", "onsite", "on-site", "on site", "work from home", "wfh", "anywhere",
+    "india", "pune", "mumbai", "bombay", "delhi", "new delhi", "delhi ncr", "ncr", "noida", "gurgaon",
+    "gurugram", "bangalore", "bengaluru", "hyderabad", "chennai", "kolkata", "ahmedabad", "jaipur",
+    "kochi", "indore", "chandigarh", "coimbatore", "thiruvananthapuram", "nagpur", "mysore",
+    "usa", "united states", "uk", "united kingdom", "canada", "germany", "singapore", "dubai", "uae",
+    "new york", "nyc", "san francisco", "bay area", "seattle", "austin", "boston", "chicago",
+    "los angeles", "london", "toronto", "berlin", "amsterdam", "sydney", "worldwide", "global",
+}
+_HIRING_RE = re.compile(r"^(?P<company>.+?)\s+hiring\s+(?P<title>.+?)(?:\s+in\s+(?P<location>.+))?$", re.IGNORECASE)
+_AT_RE = re.compile(r"^(?P<title>.+?)\s+(?:at|@)\s+(?P<company>.+)$", re.IGNORECASE)
+
+
+def _load_resume(resume):
+    if isinstance(resume, str):
+        try:
+            resume = json.loads(resume)
+        except ValueError:
+            return {}
+    return resume if isinstance(resume, dict) else {}
+
+
+def build_queries(resume, job_title="", location="", max_queries=2):
+    """
+    Build web search queries from the parsed resume without the LLM.
+
+    The role is `job_title`, else the most recent experience title; the second query
+    adds the candidate's two leading skills from the taxonomy.
+
+    Returns:
+        tuple: (role, skills, [query, ...])
+    """
+    resume = _load_resume(resume)
+    role = (job_title or "").strip()
+    if not role:
+        for item in resume.get("experience") or []:
+            if isinstance(item, dict) and item.get("title"):
+                role = str(item["title"]).strip()
+                break
+    role = role or "software engineer"
+
+    # Leading skills in the order the resume lists them
+    matcher = get_skill_matcher()
+    listed = resume.get("skills")
+    if isinstance(listed, dict):
+        listed = [s for values in listed.values() if isinstance(values, list) for s in values]
+    skills = []
+    for entry in listed if isinstance(listed, list) else []:
+        for skill in sorted(matcher.find_skills(str(entry))):
+            if skill not in skills and skill.lower() not in role.lower():
+                skills.append(skill)
+
+    where = f" in {location}" if location else ""
+    queries = [f"{role} jobs{where}"]
+    if skills:
+        queries.append(f"{role} {' '.join(skills[:2])} jobs{where}")
+    return role, skills, queries[:max_queries]
+
+
+def is_listing_page(title, url):
+    """True for search-result or listing pages (many jobs on one page) rather than a single posting."""
+    path = urlsplit(url)
+    return bool(_LISTING_TITLE_RE.search(title) or _LISTING_URL_RE.search(f"{path.path}?{path.query}"))
+
+
+def _is_location(text, location=""):
+    """True when `text` names a place or work mode ("Remote", "Pune, Maharashtra") or the searched location."""
+    head = re.split(r"[,(/]", text.lower(), maxsplit=1)[0].strip()
+    if not head:
+        return False
+    searched = {part.strip() for part in re.split(r"[,(/]", location.lower()) if part.strip()}
+    return head in LOCATION_WORDS or head in searched
+
+
+def parse_search_result(item, location=""):
+    """
+    Turn one search hit ({"title", "url", "snippet", ...}) into the search_jobs schema:
+    title, company, url, snippet, match_score (filled in later), plus location/source.
+
+    Handles the common board title shapes: "Acme hiring Python Developer in Pune",
+    "Python Developer at Acme", "Python Developer - Acme | LinkedIn".
+
+    Place and work-mode words ("Python Developer - Remote") become the location, never
+    the company.
+
+    Returns:
+        dict | None: None for hits without a URL and for listing pages
+    """
+    url = item.get("url") or ""
+    if not url:
+        return None
+    raw_title = _SITE_SUFFIX_RE.sub("", (item.get("title") or "").strip()).strip()
+    if is_listing_page(raw_title, url):
+        return None
+    title, company, job_location = raw_title, "", ""
+
+    hiring = _HIRING_RE.match(raw_title)
+    at = _AT_RE.match(raw_title)
+    if hiring:
+        title, company, job_location = hiring.group("title"), hiring.group("company"), hiring.group("location") or ""
+    elif at:
+        title, company = at.group("title"), at.group("company")
+    else:
+        parts = [part.strip() for part in re.split(r"\s+[|\-–—]\s+", raw_title) if part.strip()]
+        if len(parts) >= 2:
+            title = parts[0]
+            for part in parts[1:]:
+                if _is_location(part, location):
+                    job_location = job_location or part
+                elif not company:
+                    company = part
+    if company and _is_location(company, location):
+        job_location, company = job_location or company, ""
+
+    if not company:
+        host = (urlsplit(url).hostname or "").split(".")
+        label = host[-2] if len(host) >= 2 else ""
+        if label and label not in JOB_BOARDS:
+            company = label.capitalize()
+
+    job = {
+        "title": title.strip(" -|"),
+        "company": company.strip(" -|"),
+        "url": url,
+        "snippet": (item.get("snippet") or "").strip(),
+        "match_score": None,
+        "location": job_location or location,
+    }
+    if item.get("sources") or item.get("source"):
+        job["sources"] = item.get("sources") or [item["source"]]
+    return job
+
+
+def score_jobs(resume, jobs):
+    """
+    Score jobs locally and sort them best first.
+
+    match_score blends embedding similarity (70%) with the skill overlap (30%); without an
+    embedding backend it is the skill overlap alone, or None when the job names no known
+    skills (any score the job dict already carried is discarded).
+    """
+    jobs = annotate_jobs(resume, jobs)
+    try:
+        jobs = get_job_vector_index().score_jobs(resume, jobs)
+        similarity = True
+    except Exception as e:
+        print(f"Embedding match scoring unavailable, using skill overlap: {e}")
+        similarity = False
+
+    for job in jobs:
+        overlap = job.get("skill_overlap")
+        if similarity:
+            if overlap is not None:
+                job["match_score"] = round(0.7 * job["match_score"] + 0.3 * overlap, 3)
+        else:
+            job["match_score"] = overlap
+    return sorted(jobs, key=lambda job: job["match_score"] or 0.0, reverse=True)
+
+
+def rerank_with_llm(resume, jobs, top_n=10):
+    """
+    Re-order the top `top_n` jobs with a single LLM call; the rest keep their order.
+    Any LLM or decoding failure leaves the local ranking unchanged.
+    """
+    head, tail = jobs[:top_n], jobs[top_n:]
+    if len(head) < 2:
+        return jobs
+    resume = _load_resume(resume)
+    listing = "\n".join(
+        f"{i}. {job['title']} @ {job.get('company') or '?'}: {job.get('snippet', '')[:200]}"
+        for i, job in enumerate(head)
+    )
+    prompt = (
+        "Rank these jobs for the candidate, best fit first.\n"
+        f"Candidate summary: {resume.get('summary', '')}\n"
+        f"Candidate skills: {json.dumps(resume.get('skills', {}), ensure_ascii=False)}\n\n"
+        f"Jobs:\n{listing}\n\n"
+        "Return only a JSON array of the job numbers, e.g. [2, 0, 1]."
+    )
+    try:
+        order = decode_llm_json(get_llm_service().generate_response(prompt))
+    except Exception as e:  # includes LLMJSONDecodeError
+        print(f"LLM re-ranking skipped: {e}")
+        return jobs
+    if not isinstance(order, list):
+        return jobs
+    seen = []
+    for index in order:
+        if isinstance(index, int) and 0 <= index < len(head) and index not in seen:
+            seen.append(index)
+    seen += [i for i in range(len(head)) if i not in seen]
+    return [head[i] for i in seen] + tail
+
+
+def finalize_jobs(resume, jobs):
+    """
+    Shared post-processing for both search modes: de-duplicate, score locally, attach
+    skill gaps and store the jobs as listings for the local BM25 index.
+    """
+    jobs = score_jobs(resume, dedupe_jobs(jobs))
+    save_job_listings(jobs)
+    return jobs
+
+
+def run_direct_job_search(resume_data, job_title="", location="", max_results=JOB_SEARCH_MAX_RESULTS,
+                          rerank=JOB_SEARCH_LLM_RERANK):
+    """
+    Job search without the CrewAI agent loop.
+
+    Queries are built from the parsed resume in code, run concurrently through the
+    federated search (and against stored listings), parsed into the search_jobs schema,
+    de-duplicated and scored locally. The LLM is called at most once, as an optional re-ranker.
+
+    Args:
+        resume_data (dict | str): Parsed resume (or its JSON)
+        job_title (str): Role to search for; defaults to the latest experience title
+        location (str): Location filter
+        max_results (int): Number of jobs returned
+        rerank (bool): Re-order the top jobs with one LLM call
+
+    Returns:
+        list: Job dicts (title, company, url, snippet, match_score, skill gap fields)
+    """
+    role, skills, queries = build_queries(resume_data, job_title, location)
+
+    local = []
+    try:
+        local = get_job_index().search(" ".join([role] + skills[:3]), k=JOB_SEARCH_LOCAL_RESULTS, location=location)
+    except Exception as e:
+        print(f"Local job index unavailable: {e}")
+
+    search = get_federated_search()
+    with ThreadPoolExecutor(max_workers=max(1, len(queries))) as executor:
+        responses = list(executor.map(search.search, queries))
+
+    jobs = []
+    unlinked = listings = 0
+    for response in responses:
+        for item in response["results"]:
+            job = parse_search_result(item, location=location)
+            if job is not None:
+                jobs.append(job)
+            elif item.get("url"):
+                listings += 1
+            else:
+                unlinked += 1
+    if unlinked:
+        # Snippet-only hits (e.g. DuckDuckGo's text output) cannot be stored or de-duplicated
+        print(f"Skipped {unlinked} search results without a URL.")
+    if listings:
+        print(f"Skipped {listings} job listing pages.")
+    for job in local:
+        # Drop per-search and storage fields kept with the listing; they are recomputed below
+        job = {key: value for key, value in job.items() if key not in ("bm25_score", "listing_id", "duplicates", "id")}
+        jobs.append(dict(job, sources=list(job.get("sources") or []) + ["local"]))
+
+    jobs = finalize_jobs(resume_data, jobs)
+    if rerank:
+        jobs = rerank_with_llm(resume_data, jobs)
+    return jobs[:max_results]
@@ -0,0 +1,389 @@
+# services/job_vectors.py
+import os
+import json
+import threading
+
+import numpy as np
+
+from services.llm_service import get_llm_service
+from services.job_index import job_listing_id
+from config.config import JOB_VECTOR_DIR, JOB_VECTOR_MODE, JOB_VECTOR_IVF_MIN_JOBS, JOB_VECTOR_NPROBE
+
+
+def job_text(job):
+    """Text embedded for a job: title, company, location and snippet."""
+    return " | ".join(
+        str(job.get(field)).strip() for field in ("title", "company", "location", "snippet") if job.get(field)
+    )
+
+
+def resume_text(resume):
+    """
+    Text embedded for a parsed resume: summary, skills, and experience/project titles.
+    Plain strings (e.g. raw resume text) are returned as-is.
+    """
+    if isinstance(resume, str):
+        try:
+            resume = json.loads(resume)
+        except ValueError:
+            return resume
+    if not isinstance(resume, dict):
+        return str(resume)
+
+    parts = [str(resume.get("summary") or "")]
+    skills = resume.get("skills")
+    if isinstance(skills, dict):
+        parts.append(", ".join(str(s) for values in skills.values() if isinstance(values, list) for s in values))
+    elif isinstance(skills, list):
+        parts.append(", ".join(str(s) for s in skills))
+    for section, field in (("experience", "title"), ("projects", "title")):
+        for item in resume.get(section) or []:
+            if isinstance(item, dict) and item.get(field):
+                parts.append(str(item[field]))
+    return "\n".join(part for part in parts if part.strip())
+
+
+def top_k(scores, k):
+    """Indexes of the `k` largest scores, best first, via argpartition (O(n) + O(k log k))."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def _kmeans(matrix, n_clusters, iterations=10, seed=0):
+    """Spherical k-means on L2-normalized rows; returns normalized centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = matrix[rng.choice(len(matrix), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = np.argmax(matrix @ centroids.T, axis=1)
+        for c in range(n_clusters):
+            members = matrix[assignments == c]
+            if len(members):
+                centroid = members.sum(axis=0)
+                centroids[c] = centroid / max(np.linalg.norm(centroid), 1e-12)
+    return centroids
+
+
+class JobVectorIndex:
+    """
+    Embedding index over job postings for resume matching.
+
+    Job vectors are L2-normalized rows of one float32 matrix, so scoring a resume
+    against every job is a single matrix-vector product. Exact mode ranks all rows;
+    "ivf" mode first picks the `nprobe` nearest k-means cells (a coarse quantizer built
+    by build_ivf) and only scores the jobs in them, for corpora in the hundreds of thousands.
+
+    On disk the index is append-only, like EmbeddingCache:
+        vectors.f32  raw row-major float32 vectors, one row per job
+        jobs.jsonl   JSON header line ({"model_id", "dim"}) followed by one {"id", "job"}
+                     record per line; the first record for an id owns the next vector row,
+                     later ones refresh its metadata
+    Saving only appends what changed since the last save; the files are rewritten (compacted)
+    when superseded records outnumber the live jobs.
+    """
+
+    VECTOR_FILE = "vectors.f32"
+    JOBS_FILE = "jobs.jsonl"
+
+    def __init__(self, index_dir=JOB_VECTOR_DIR, llm=None):
+        """
+        Args:
+            index_dir (str): Directory holding vectors.f32 and jobs.jsonl
+            llm (LLMService, optional): Embedding provider; defaults to the shared service
+        """
+        self.index_dir = index_dir
+        os.makedirs(index_dir, exist_ok=True)
+        self.llm = llm or get_llm_service()
+        self.model_id = self.llm.get_embedding().model_id
+
+        self._lock = threading.RLock()
+        self.ids = []
+        self.jobs = []
+        self._positions = {}
+        self._matrix = np.zeros((0, 0), dtype=np.float32)  # capacity rows; first len(ids) are live
+        self._saved = 0          # rows already on disk
+        self._refreshed = set()  # saved rows whose metadata changed since the last save
+        self._records = 0        # records in jobs.jsonl, including superseded ones
+        self.centroids = None
+        self._lists = None
+        self._load()
+
+    # ----- persistence -------------------------------------------------
+
+    def _paths(self):
+        return os.path.join(self.index_dir, self.VECTOR_FILE), os.path.join(self.index_dir, self.JOBS_FILE)
+
+    def _header(self):
+        return json.dumps({"model_id": self.model_id, "dim": self._matrix.shape[1] or None}) + "\n"
+
+    def _load(self):
+        vectors_path, jobs_path = self._paths()
+        try:
+            with open(jobs_path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                lines = f.readlines()
+            vectors = np.fromfile(vectors_path, dtype=np.float32)
+        except (OSError, ValueError):
+            self.compact()
+            return
+        dim = header.get("dim")
+        if header.get("model_id") != self.model_id:
+            print("Job vector index used another embedding model; rebuilding.")
+            self.compact()
+            return
+        if not dim:
+            self.compact()
+            return
+
+        ids, jobs, positions = [], [], {}
+        records = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # torn final line from an interrupted append
+            records += 1
+            job_id = record.get("id")
+            if job_id in positions:
+                jobs[positions[job_id]] = record.get("job")
+            else:
+                positions[job_id] = len(ids)
+                ids.append(job_id)
+                jobs.append(record.get("job"))
+
+        # A crash between the vector and jobs appends can leave them out of step; keep the common prefix.
+        n = min(len(ids), len(vectors) // dim)
+        self.ids, self.jobs = ids[:n], jobs[:n]
+        self._positions = {job_id: i for i, job_id in enumerate(self.ids)}
+        self._matrix = np.ascontiguousarray(vectors[:n * dim].reshape(n, dim))
+        self._saved = n
+        self._records = records
+        if n != len(ids) or n * dim != len(vectors) or records != len(lines):
+            self.compact()
+
+    def save(self):
+        """Append jobs added or refreshed since the last save to disk."""
+        vectors_path, jobs_path = self._paths()
+        with self._lock:
+            n = len(self.ids)
+            rows = sorted(self._refreshed) + list(range(self._saved, n))
+            if not rows:
+                return
+            if self._records + len(rows) > 2 * n + 1000:
+                self.compact()
+                return
+            try:
+                lines = [json.dumps({"id": self.ids[i], "job": self.jobs[i]}, ensure_ascii=False) + "\n" for i in rows]
+                if self._saved == 0:
+                    with open(jobs_path, "w", encoding="utf-8") as f:
+                        f.write(self._header())  # the first rows fix the dimension
+                with open(vectors_path, "ab" if self._saved else "wb") as f:
+                    f.write(self._matrix[self._saved:n].tobytes())
+                with open(jobs_path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except (OSError, TypeError) as e:
+                print("Error writing job vector index:", e)
+                return
+            self._saved = n
+            self._refreshed.clear()
+            self._records += len(rows)
+
+    def compact(self):
+        """Rewrite both files from memory, dropping superseded metadata records."""
+        vectors_path, jobs_path = self._paths()
+        with self._lock:
+            try:
+                lines = [json.dumps({"id": job_id, "job": job}, ensure_ascii=False) + "\n"
+                         for job_id, job in zip(self.ids, self.jobs)]
+                with open(vectors_path + ".tmp", "wb") as f:
+                    f.write(self.matrix.tobytes())
+                os.replace(vectors_path + ".tmp", vectors_path)
+                with open(jobs_path + ".tmp", "w", encoding="utf-8") as f:
+                    f.write(self._header())
+                    f.writelines(lines)
+                os.replace(jobs_path + ".tmp", jobs_path)
+            except (OSError, TypeError) as e:
+                print("Error writing job vector index:", e)
+                return
+            self._saved = len(self.ids)
+            self._refreshed.clear()
+            self._records = len(lines)
+
+    # ----- building ----------------------------------------------------
+
+    @property
+    def matrix(self):
+        return self._matrix[:len(self.ids)]
+
+    def _append(self, vectors):
+        n, dim = len(self.ids), vectors.shape[1]
+        needed = n + len(vectors)
+        if self._matrix.shape[1] != dim or needed > len(self._matrix):
+            # Grow geometrically so repeated small additions stay amortized O(1) per row
+            grown = np.zeros((max(needed, 2 * len(self._matrix), 64), dim), dtype=np.float32)
+            if n:
+                grown[:n] = self._matrix[:n]
+            self._matrix = grown
+        self._matrix[n:needed] = vectors
+
+    def add_jobs(self, jobs, save=True):
+        """
+        Embed and index jobs not already present (keyed by job_listing_id). Known jobs only get
+        their metadata refreshed.
+
+        Returns:
+            int: Number of newly embedded jobs
+        """
+        with self._lock:
+            new_ids, new_jobs = [], []
+            for job in jobs:
+                if not isinstance(job, dict):
+                    continue
+                job_id = job_listing_id(job)
+                if job_id in self._positions:
+                    position = self._positions[job_id]
+                    if self.jobs[position] != job:
+                        self.jobs[position] = job
+                        if position < self._saved:
+                            self._refreshed.add(position)
+                elif job_id not in new_ids:
+                    new_ids.append(job_id)
+                    new_jobs.append(job)
+            if not new_jobs:
+                if save:
+                    self.save()
+                return 0
+
+            vectors = np.asarray(self.llm.embed_texts([job_text(job) for job in new_jobs]), dtype=np.float32)
+            start = len(self.ids)
+            self._append(vectors)
+            for offset, (job_id, job) in enumerate(zip(new_ids, new_jobs)):
+                self._positions[job_id] = start + offset
+            self.ids.extend(new_ids)
+            self.jobs.extend(new_jobs)
+            if self.centroids is not None:
+                self._assign(start)
+            if save:
+                self.save()
+            return len(new_jobs)
+
+    def sync_listings(self, job_index):
+        """Embed every listing in a JobIndex (services/job_index.py) that is not yet indexed."""
+        return self.add_jobs([doc["job"] for doc in job_index.docs.values()])
+
+    def build_ivf(self, n_lists=None, sample_size=20000):
+        """
+        Build the coarse quantizer: k-means centroids over a sample of job vectors,
+        with every job assigned to its nearest centroid.
+
+        Args:
+            n_lists (int, optional): Number of cells; defaults to ~sqrt(number of jobs)
+            sample_size (int): Maximum vectors used to fit the centroids
+        """
+        with self._lock:
+            matrix = self.matrix
+            if len(matrix) == 0:
+                return
+            n_lists = n_lists or max(1, int(np.sqrt(len(matrix))))
+            n_lists = min(n_lists, len(matrix))
+            rng = np.random.default_rng(0)
+            sample = matrix if len(matrix) <= sample_size else matrix[rng.choice(len(matrix), sample_size, replace=False)]
+            self.centroids = _kmeans(sample, min(n_lists, len(sample)))
+            self._lists = None
+            self._assign(0)
+
+    def _assign(self, start):
+        assignments = np.argmax(self.matrix[start:] @ self.centroids.T, axis=1)
+        lists = [[] for _ in range(len(self.centroids))] if self._lists is None or start == 0 else \
+            [list(cell) for cell in self._lists]
+        for offset, cell in enumerate(assignments):
+            lists[cell].append(start + offset)
+        self._lists = [np.asarray(cell, dtype=np.int64) for cell in lists]
+
+    # ----- querying ----------------------------------------------------
+
+    def _mode(self, mode):
+        mode = mode or JOB_VECTOR_MODE
+        if mode == "auto":
+            mode = "ivf" if len(self.ids) >= JOB_VECTOR_IVF_MIN_JOBS else "exact"
+        if mode == "ivf" and self.centroids is None:
+            self.build_ivf()
+        return mode
+
+    def search_vector(self, query_vector, k=10, mode=None, nprobe=JOB_VECTOR_NPROBE):
+        """
+        Rank indexed jobs by cosine similarity to `query_vector`.
+
+        Args:
+            query_vector (np.ndarray): L2-normalized query embedding
+            k (int): Number of results
+            mode (str, optional): "exact", "ivf" or "auto" (defaults to JOB_VECTOR_MODE)
+            nprobe (int): Cells scanned in ivf mode
+
+        Returns:
+            list: (position, score) pairs, best first
+        """
+        with self._lock:
+            if not self.ids:
+                return []
+            query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+            if self._mode(mode) == "ivf":
+                cells = top_k(self.centroids @ query, nprobe)
+                candidates = np.concatenate([self._lists[c] for c in cells])
+                if len(candidates) == 0:
+                    return []
+                scores = self.matrix[candidates] @ query
+                best = top_k(scores, k)
+                return [(int(candidates[i]), float(scores[i])) for i in best]
+            scores = self.matrix @ query
+            return [(int(i), float(scores[i])) for i in top_k(scores, k)]
+
+    def search(self, resume, k=10, mode=None, nprobe=JOB_VECTOR_NPROBE):
+        """
+        Return the `k` indexed jobs closest to a resume (parsed dict or text).
+
+        Each job dict gets a "match_score": the cosine similarity clipped to [0, 1].
+        """
+        query = self.llm.embed_texts([resume_text(resume)])[0]
+        return [
+            dict(self.jobs[position], match_score=round(max(0.0, min(1.0, score)), 3))
+            for position, score in self.search_vector(query, k=k, mode=mode, nprobe=nprobe)
+        ]
+
+    def score_jobs(self, resume, jobs):
+        """
+        Set each job's "match_score" to its embedding similarity with the resume,
+        indexing any jobs not seen before. Returns the jobs sorted best first.
+        """
+        jobs = [job for job in jobs if isinstance(job, dict)]
+        if not jobs:
+            return jobs
+        self.add_jobs(jobs)
+        query = np.asarray(self.llm.embed_texts([resume_text(resume)])[0], dtype=np.float32)
+        with self._lock:
+            positions = [self._positions[job_listing_id(job)] for job in jobs]
+            scores = self.matrix[positions] @ query
+        scored = [
+            dict(job, match_score=round(max(0.0, min(1.0, float(score))), 3))
+            for job, score in zip(jobs, scores)
+        ]
+        return sorted(scored, key=lambda job: job["match_score"], reverse=True)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_job_vector_index():
+    """Return the process-wide JobVectorIndex, creating it (and the embedding backend) on first use."""
+    global _shared_index
+    if _shared_index is None:
+        with _shared_index_lock:
+            if _shared_index is None:
+                _shared_index = JobVectorIndex()
+    return _shared_index
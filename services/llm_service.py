@@ -1,6 +1,13 @@
 # services/llm_services.py
 import os
+import time
+import random
+import asyncio
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import google.generativeai as genai
 
@@ -13,47 +20,214 @@ try:
 except ImportError:
     GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "your-gemini-api-key")
 
+from services.response_cache import ResponseCache
+from services.embedding_cache import EmbeddingCache
+from services.replay import (
+    ReplayMissError,
+    call_with_replay,
+    get_fixture_store,
+    provider_mode,
+    replay_delay,
+)
+
+from config.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_DIR,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_MEMORY_ITEMS,
+    LLM_CACHE_MAX_DISK_ITEMS,
+    LLM_MAX_CONCURRENCY,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_DIR,
+    GEMINI_EMBEDDING_CONNECT_TIMEOUT,
+    GEMINI_EMBEDDING_READ_TIMEOUT,
+    GEMINI_EMBEDDING_MAX_RETRIES,
+    GEMINI_EMBEDDING_POOL_SIZE,
+)
+
 # Placeholder for Gemini embedding plugin: assumes your embedding endpoint accepts a JSON POST request.
+# A single-text request sends {"text": ...} and gets {"embedding": [...]} back; a batched request
+# sends {"texts": [...]} and gets {"embeddings": [[...], ...]} back.
 class GeminiEmbeddingPlugin:
-    def __init__(self, model, deployment_name, api_key, endpoint):
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self, model, deployment_name, api_key, endpoint,
+                 timeout=(GEMINI_EMBEDDING_CONNECT_TIMEOUT, GEMINI_EMBEDDING_READ_TIMEOUT),
+                 max_retries=GEMINI_EMBEDDING_MAX_RETRIES, backoff_factor=0.5,
+                 pool_size=GEMINI_EMBEDDING_POOL_SIZE):
         self.model = model
         self.deployment_name = deployment_name
         self.api_key = api_key
         self.endpoint = endpoint
+        self.model_id = f"gemini:{model}:{deployment_name}"
+        self.dim = None  # learned from the first embedding returned
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
 
-    def embed(self, text):
-        headers = {
+        # One keep-alive session per plugin so every request reuses pooled TCP/TLS connections.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
-        }
+        })
+
+    def _post(self, data):
+        """
+        POST `data` to the embedding endpoint, retrying 429/5xx responses and
+        connection errors with jittered exponential backoff.
+        """
+        return call_with_replay("gemini_embedding", data, lambda: self._post_live(data))
+
+    def _post_live(self, data):
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(self.endpoint, json=data, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return response.json()
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    time.sleep(min(float(retry_after), 60))
+                    continue
+            # Full jitter keeps concurrent clients from retrying in lockstep.
+            time.sleep(random.uniform(0, self.backoff_factor * (2 ** attempt)))
+
+    def embed(self, text):
         data = {
             "model": self.model,
             "deployment": self.deployment_name,
             "text": text
         }
         try:
-            response = requests.post(self.endpoint, json=data, headers=headers)
-            response.raise_for_status()
-            embedding = response.json().get("embedding")
-            return embedding
+            return self._post(data).get("embedding")
         except Exception as e:
             print("Error using Gemini embedding:", e)
             return None
 
+    def embed_batch(self, texts):
+        """
+        Embed several texts in one request.
+
+        Falls back to one request per text if the endpoint does not return an
+        "embeddings" list.
+
+        Returns:
+            list: One embedding (list of floats) per input text
+        """
+        data = {
+            "model": self.model,
+            "deployment": self.deployment_name,
+            "texts": list(texts)
+        }
+        embeddings = self._post(data).get("embeddings")
+        if not isinstance(embeddings, list) or len(embeddings) != len(texts):
+            embeddings = [self.embed(text) for text in texts]
+        return embeddings
+
+    def embed_many(self, texts, batch_size=32, normalize=True, dtype="float32"):
+        """
+        Embed several texts into a single (n, dim) NumPy matrix.
+
+        Args:
+            texts (list[str]): Texts to embed
+            batch_size (int): Number of texts sent per request
+            normalize (bool): L2-normalize each row
+            dtype (str): "float32", "float16" or "int8"
+
+        Returns:
+            np.ndarray: Contiguous matrix with one row per input text
+        """
+        texts = list(texts)
+        rows = []
+        for start in range(0, len(texts), batch_size):
+            for offset, embedding in enumerate(self.embed_batch(texts[start:start + batch_size])):
+                if embedding is None:
+                    raise RuntimeError(f"Gemini embedding failed for text #{start + offset}")
+                rows.append(embedding)
+        if rows:
+            self.dim = len(rows[0])
+        return _finalize_embeddings(rows, normalize=normalize, dtype=dtype, dim=self.dim or 0)
+
 # Fallback embedding using Hugging Face's SentenceTransformers
 class HuggingFaceEmbeddingPlugin:
     def __init__(self, model_name='sentence-transformers/all-MiniLM-L6-v2'):
         from sentence_transformers import SentenceTransformer
         self.model = SentenceTransformer(model_name)
+        self.model_id = f"huggingface:{model_name}"
 
     def embed(self, text):
         return self.model.encode(text, convert_to_tensor=True)
 
+    def embed_many(self, texts, batch_size=32, normalize=True, dtype="float32"):
+        """
+        Embed several texts in batched forward passes.
+
+        Args:
+            texts (list[str]): Texts to embed
+            batch_size (int): Number of texts per encoder batch
+            normalize (bool): L2-normalize each row
+            dtype (str): "float32", "float16" or "int8"
+
+        Returns:
+            np.ndarray: Contiguous matrix with one row per input text
+        """
+        texts = list(texts)
+        dim = self.model.get_sentence_embedding_dimension() or 0
+        if not texts:
+            return _finalize_embeddings([], normalize=normalize, dtype=dtype, dim=dim)
+        matrix = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return _finalize_embeddings(matrix, normalize=normalize, dtype=dtype, dim=dim)
+
+
+def _finalize_embeddings(rows, normalize=True, dtype="float32", dim=0):
+    """
+    Convert raw embedding rows to a contiguous matrix, optionally normalized and quantized.
+
+    int8 output stores round(v * 127) of the L2-normalized vectors, so it requires normalize=True.
+    An empty batch gives an empty (0, dim) matrix.
+    """
+    if dtype not in ("float32", "float16", "int8"):
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+    if dtype == "int8" and not normalize:
+        raise ValueError("int8 embeddings require normalize=True")
+
+    matrix = np.asarray(rows, dtype=np.float32)
+    if matrix.size == 0:
+        return np.empty((0, dim), dtype=dtype)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if normalize and matrix.size:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, np.maximum(norms, 1e-12), out=matrix)
+
+    if dtype == "float16":
+        matrix = matrix.astype(np.float16)
+    elif dtype == "int8":
+        matrix = np.rint(matrix * 127).astype(np.int8)
+    return np.ascontiguousarray(matrix)
+
 class LLMService:
-    def __init__(self):
+    def __init__(self, cache=None):
         """
         Initialize the LLM service using environment variables and default settings.
         The default parameters can be updated as needed.
+
+        Args:
+            cache (ResponseCache | bool, optional): Response cache to use. Pass False
+                to disable caching; None builds one from the LLM_CACHE_* settings.
         """
         self.api_key = GEMINI_API_KEY
         if not self.api_key:
@@ -67,13 +241,34 @@ class LLMService:
             "Strictly avoid using sensitive, jailbreak, hate or offensive language."
         )
 
+        if cache is None:
+            cache = LLM_CACHE_ENABLED
+        if cache is True:
+            cache = ResponseCache(
+                cache_dir=LLM_CACHE_DIR,
+                max_memory_items=LLM_CACHE_MAX_MEMORY_ITEMS,
+                max_disk_items=LLM_CACHE_MAX_DISK_ITEMS,
+                ttl=LLM_CACHE_TTL,
+            )
+        self.cache = cache or None
+
+        # Process-wide cap on in-flight LLM requests, shared by every caller's thread pool
+        # (bulk ingestion, section-chunked extraction, generate_many), so nested pools
+        # cannot multiply past it.
+        self.max_concurrency = max(1, LLM_MAX_CONCURRENCY)
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
+
         # Embedding-related settings
         self.gemini_embedding_endpoint = os.getenv("GEMINI_EMBEDDING_ENDPOINT")
         self.embedding_model = "models/embedding-gemini"
         self.embedding_deployment = "gemini-embedding-deployment"
 
+        # The embedding backend is loaded on the first get_embedding() call
+        self.embedding = None
+        self.embedding_cache = None
+        self._embedding_lock = threading.Lock()
+
         self.initialize_llm()
-        self.initialize_embedding()
 
     def initialize_llm(self):
         """
@@ -81,19 +276,193 @@ class LLMService:
         Reference: https://developers.google.com/generativeai
         """
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel("gemini-2.0-flash")
+        self.model_name = "gemini-2.0-flash"
+        self.model = genai.GenerativeModel(self.model_name)
         # If the API offers additional endpoint settings, include them as needed.
 
+    def _cache_key(self, prompt):
+        """Return the response-cache key for `prompt`, or None if caching is disabled."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(
+            self.model_name,
+            self.system_prompt,
+            prompt,
+            {"temperature": self.temperature, "max_tokens": self.max_tokens},
+        )
+
     def generate_response(self, prompt):
         """
         Generate a text response using the Gemini LLM.
         Combines the system prompt with the user prompt.
+        Identical requests are served from the response cache when it is enabled.
         """
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         full_prompt = f"{self.system_prompt}\n{prompt}"
-        response = self.model.generate_content(full_prompt)
-        generated_text = response.text.strip() if response.text else ""
+        with self._request_slots:
+            generated_text = call_with_replay(
+                "llm",
+                self._replay_request(full_prompt),
+                lambda: self._generate_live(full_prompt),
+            )
+
+        # Empty responses are usually failures (safety blocks, quota), so don't pin them.
+        if cache_key is not None and generated_text:
+            self.cache.set(cache_key, generated_text)
         return generated_text
 
+    def stream_response(self, prompt):
+        """
+        Generate a response as a stream of text chunks.
+
+        Yields chunks as Gemini produces them. A cached response is yielded as a
+        single chunk, and a completed stream is written back to the cache.
+        """
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        full_prompt = f"{self.system_prompt}\n{prompt}"
+        chunks = []
+        with self._request_slots:
+            for text in self._stream_chunks(full_prompt):
+                chunks.append(text)
+                yield text
+
+        generated_text = "".join(chunks).strip()
+        if cache_key is not None and generated_text:
+            self.cache.set(cache_key, generated_text)
+
+    def _replay_request(self, full_prompt, stream=False):
+        return {
+            "model": self.model_name,
+            "prompt": full_prompt,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stream": stream,
+        }
+
+    def _generate_live(self, full_prompt):
+        response = self.model.generate_content(full_prompt)
+        return response.text.strip() if response.text else ""
+
+    def _stream_chunks(self, full_prompt):
+        """
+        Yield raw text chunks for `full_prompt`, honouring the record/replay provider mode.
+        Replayed chunks are spread evenly over the simulated latency.
+        """
+        mode = provider_mode()
+        request = self._replay_request(full_prompt, stream=True)
+        store = get_fixture_store()
+
+        if mode == "replay":
+            entry = store.load("llm", request)
+            if entry is None:
+                # Fall back to a recorded non-streaming response for the same prompt.
+                entry = store.load("llm", self._replay_request(full_prompt))
+                if entry is not None:
+                    entry = dict(entry, response=[entry["response"]])
+            if entry is None:
+                raise ReplayMissError(f"No llm fixture recorded for request {store.make_key(request)}")
+            recorded = entry["response"]
+            delay = replay_delay(entry.get("latency")) / max(len(recorded), 1)
+            for text in recorded:
+                if delay > 0:
+                    time.sleep(delay)
+                yield text
+            return
+
+        started = time.perf_counter()
+        chunks = []
+        for chunk in self.model.generate_content(full_prompt, stream=True):
+            text = chunk.text if chunk.parts else ""
+            if text:
+                chunks.append(text)
+                yield text
+        if mode == "record":
+            store.save("llm", request, chunks, time.perf_counter() - started)
+
+    def set_max_concurrency(self, max_concurrency):
+        """
+        Change the process-wide cap on in-flight LLM requests (e.g. from a CLI flag).
+        Call it before issuing requests; requests already in flight keep their slots.
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    def generate_many(self, prompts, max_concurrency=None, return_exceptions=True):
+        """
+        Generate responses for several prompts concurrently.
+
+        Args:
+            prompts (list[str]): Prompts to send to the LLM
+            max_concurrency (int, optional): Maximum number of in-flight requests
+                (defaults to LLM_MAX_CONCURRENCY)
+            return_exceptions (bool): If True, a failed prompt yields its exception
+                in place of the text; otherwise the first failure is raised
+
+        Returns:
+            list: Generated texts (or exceptions) in the same order as `prompts`
+        """
+        prompts = list(prompts)
+        if not prompts:
+            return []
+        workers = max(1, min(max_concurrency or LLM_MAX_CONCURRENCY, len(prompts)))
+
+        def _generate(prompt):
+            try:
+                return self.generate_response(prompt)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate, prompts))
+
+    async def agenerate(self, prompt):
+        """
+        Async counterpart of generate_response; runs the blocking call in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt)
+
+    async def agenerate_many(self, prompts, max_concurrency=None, return_exceptions=True):
+        """
+        Async counterpart of generate_many.
+
+        Args:
+            prompts (list[str]): Prompts to send to the LLM
+            max_concurrency (int, optional): Maximum number of in-flight requests
+            return_exceptions (bool): If True, failures are returned in place of the text
+
+        Returns:
+            list: Generated texts (or exceptions) in the same order as `prompts`
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or LLM_MAX_CONCURRENCY))
+
+        async def _generate(prompt):
+            async with semaphore:
+                return await self.agenerate(prompt)
+
+        return await asyncio.gather(
+            *(_generate(prompt) for prompt in prompts),
+            return_exceptions=return_exceptions,
+        )
+
+    def get_cache_stats(self):
+        """
+        Return hit/miss counters for the response cache, or None if caching is disabled.
+        """
+        return self.cache.stats() if self.cache is not None else None
+
     def initialize_embedding(self):
         """
         Initialize embeddings using Gemini if the endpoint is available,
@@ -131,9 +500,54 @@ class LLMService:
     def get_embedding(self):
         """
         Return the current embedding instance (Gemini or Hugging Face).
+        The backend is initialized lazily on first use.
         """
+        if self.embedding is None:
+            with self._embedding_lock:
+                if self.embedding is None:
+                    self.initialize_embedding()
         return self.embedding
 
+    def embed_texts(self, texts, batch_size=64):
+        """
+        Return L2-normalized float32 embeddings for `texts`, one row per text.
+
+        Vectors already present in the on-disk embedding cache are reused; only
+        unseen texts are sent to the embedding backend, in batches.
+        """
+        embedding = self.get_embedding()
+
+        def _embed(batch):
+            return embedding.embed_many(batch, batch_size=batch_size)
+
+        if not EMBEDDING_CACHE_ENABLED:
+            return _embed(list(texts))
+
+        with self._embedding_lock:
+            if self.embedding_cache is None:
+                self.embedding_cache = EmbeddingCache(
+                    cache_dir=EMBEDDING_CACHE_DIR,
+                    model_id=embedding.model_id,
+                )
+        return self.embedding_cache.get_many(texts, _embed, batch_size=batch_size)
+
+
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+def get_llm_service():
+    """
+    Return the process-wide shared LLMService, creating it on first use.
+    Safe to call from multiple threads; construction happens at most once.
+    """
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = LLMService()
+    return _shared_service
+
 # # Example usage:
 # if __name__ == "__main__":
 #     service = LLMService()
@@ -0,0 +1,126 @@
+# services/replay.py
+import os
+import json
+import time
+import hashlib
+import functools
+from pathlib import Path
+
+from config.config import PROVIDER_MODE, PROVIDER_FIXTURE_DIR, PROVIDER_REPLAY_LATENCY
+
+MODES = ("live", "record", "replay")
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when no fixture was recorded for a request."""
+
+
+class FixtureStore:
+    """
+    Stores provider request -> response pairs as JSON files, one file per request:
+    <fixture_dir>/<namespace>/<sha256 of request>.json
+    """
+
+    def __init__(self, fixture_dir=PROVIDER_FIXTURE_DIR):
+        self.fixture_dir = Path(fixture_dir)
+
+    @staticmethod
+    def make_key(request):
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, namespace, request):
+        return self.fixture_dir / namespace / f"{self.make_key(request)}.json"
+
+    def load(self, namespace, request):
+        """Return the recorded entry ({"response", "latency"}) or None."""
+        path = self._path(namespace, request)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, namespace, request, response, latency):
+        """Record `response` for `request`, overwriting any previous recording."""
+        path = self._path(namespace, request)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"request": request, "response": response, "latency": latency}
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+
+def provider_mode():
+    """Return the active provider mode: "live", "record" or "replay"."""
+    mode = os.getenv("PROVIDER_MODE", PROVIDER_MODE).lower()
+    if mode not in MODES:
+        raise ValueError(f"PROVIDER_MODE must be one of {MODES}, got {mode!r}")
+    return mode
+
+
+def replay_delay(recorded_latency):
+    """
+    Return the simulated latency (seconds) for a replayed call.
+
+    PROVIDER_REPLAY_LATENCY is either "recorded" (reuse the latency measured while
+    recording) or a fixed number of milliseconds.
+    """
+    setting = os.getenv("PROVIDER_REPLAY_LATENCY", PROVIDER_REPLAY_LATENCY).strip().lower()
+    if setting == "recorded":
+        return float(recorded_latency or 0)
+    return float(setting) / 1000
+
+
+def get_fixture_store():
+    return FixtureStore(os.getenv("PROVIDER_FIXTURE_DIR", PROVIDER_FIXTURE_DIR))
+
+
+def call_with_replay(namespace, request, live_fn):
+    """
+    Run `live_fn()` according to the provider mode.
+
+    live:   call the provider
+    record: call the provider and store request -> response in the fixture store
+    replay: return the stored response after the simulated latency, never calling the provider
+
+    Args:
+        namespace (str): Fixture namespace (e.g. "llm", "tavily")
+        request (dict): JSON-serializable description of everything that determines the response
+        live_fn (callable): Zero-argument function performing the real call
+
+    Raises:
+        ReplayMissError: In replay mode, if the request was never recorded
+    """
+    mode = provider_mode()
+    if mode == "live":
+        return live_fn()
+
+    store = get_fixture_store()
+    if mode == "replay":
+        entry = store.load(namespace, request)
+        if entry is None:
+            raise ReplayMissError(f"No {namespace} fixture recorded for request {store.make_key(request)}")
+        delay = replay_delay(entry.get("latency"))
+        if delay > 0:
+            time.sleep(delay)
+        return entry["response"]
+
+    started = time.perf_counter()
+    response = live_fn()
+    store.save(namespace, request, response, time.perf_counter() - started)
+    return response
+
+
+def replayable(namespace):
+    """
+    Decorator for tool `_run` methods: records/replays calls keyed on the tool
+    class and its arguments.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            request = {"tool": type(self).__name__, "args": list(args), "kwargs": kwargs}
+            return call_with_replay(namespace, request, lambda: func(self, *args, **kwargs))
+        return wrapper
+    return decorator
@@ -0,0 +1,173 @@
+# services/response_cache.py
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class ResponseCache:
+    """
+    Two-tier (in-memory LRU + on-disk JSON) cache for LLM responses.
+
+    Entries are keyed by a SHA-256 hash of everything that influences the
+    generated text, so identical requests are served without calling the model.
+    """
+
+    def __init__(self, cache_dir="data/cache/llm_responses", max_memory_items=256,
+                 max_disk_items=2048, ttl=7 * 24 * 3600):
+        """
+        Args:
+            cache_dir (str): Directory for the on-disk tier
+            max_memory_items (int): Maximum number of entries kept in memory
+            max_disk_items (int): Maximum number of entry files kept on disk
+            ttl (int): Time-to-live for entries in seconds (0 disables expiry)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.ttl = ttl
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_count = sum(1 for _ in self.cache_dir.glob("*.json"))
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model_name, system_prompt, prompt, params=None):
+        """
+        Build a content-addressed cache key.
+
+        Args:
+            model_name (str): Name of the model generating the response
+            system_prompt (str): System prompt prepended to the request
+            prompt (str): User prompt
+            params (dict, optional): Generation parameters (temperature, max_tokens, ...)
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "system_prompt": system_prompt,
+                "prompt": prompt,
+                "params": params or {},
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created):
+        return bool(self.ttl) and (time.time() - created) > self.ttl
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached response for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._is_expired(entry["created"]):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return entry["response"]
+                del self._memory[key]
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        with self._lock:
+            if entry is None or self._is_expired(entry.get("created", 0)):
+                if entry is not None:
+                    self._remove_file(path)
+                self.misses += 1
+                return None
+            self._remember(key, entry)
+            self.hits += 1
+            self.disk_hits += 1
+            return entry["response"]
+
+    def set(self, key, response):
+        """Store `response` under `key` in both tiers."""
+        entry = {"created": time.time(), "response": response}
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        is_new = not path.exists()
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print("Error writing LLM response cache:", e)
+            is_new = False
+
+        with self._lock:
+            self._remember(key, entry)
+            if is_new:
+                self._disk_count += 1
+                if self._disk_count > self.max_disk_items:
+                    self._evict_disk()
+
+    def clear(self):
+        """Drop every cached entry from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            for path in self.cache_dir.glob("*.json"):
+                self._remove_file(path)
+            self._disk_count = 0
+
+    def stats(self):
+        """Return hit/miss counters and current tier sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_items": len(self._memory),
+                "disk_items": self._disk_count,
+            }
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _evict_disk(self):
+        """Delete the oldest files until the disk tier is ~10% under its limit."""
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        target = int(self.max_disk_items * 0.9)
+        excess = len(files) - target
+        for path in files[:max(excess, 0)]:
+            self._remove_file(path)
+            self._memory.pop(path.stem, None)
+            self.evictions += 1
+        self._disk_count = min(len(files), target)
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
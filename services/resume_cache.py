@@ -0,0 +1,54 @@
+# services/resume_cache.py
+import hashlib
+
+from data.data_manager import DataManager
+
+# The key hashes the uploaded bytes only, so bump this in every change to how the text is
+# extracted or normalized, the prompts, or the output shape; otherwise stale analyses are reused.
+RESUME_CACHE_VERSION = 6
+
+_data_manager = None
+
+
+def _get_data_manager():
+    global _data_manager
+    if _data_manager is None:
+        _data_manager = DataManager()
+    return _data_manager
+
+
+def resume_fingerprint(content):
+    """
+    Return the SHA-256 hex digest of the raw resume bytes.
+
+    Args:
+        content (bytes | memoryview): Uploaded file contents
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def _cache_key(digest):
+    return f"resume_v{RESUME_CACHE_VERSION}_{digest}"
+
+
+def get_cached_resume(digest):
+    """
+    Look up a previously processed resume.
+
+    Returns:
+        dict | None: {"text": extracted text, "result": structured JSON or None}
+    """
+    try:
+        return _get_data_manager().get_cached_data(_cache_key(digest))
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_resume(digest, text, result=None):
+    """
+    Store the extracted text and (optionally) the structured analysis for a resume.
+    """
+    try:
+        _get_data_manager().save_cached_data(_cache_key(digest), {"text": text, "result": result})
+    except (OSError, TypeError) as e:
+        print("Error writing resume cache:", e)
@@ -0,0 +1,318 @@
+# services/search_cache.py
+import os
+import re
+import json
+import time
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from data.data_manager import DataManager
+from config.config import (
+    SEARCH_CACHE_ENABLED, SEARCH_CACHE_TTLS, SEARCH_CACHE_DEFAULT_TTL,
+    SEARCH_CACHE_STALE_TTL, SEARCH_CACHE_MAX_ITEMS,
+)
+
+# Canonical location -> aliases, matched as whole phrases (longest first)
+LOCATION_ALIASES = {
+    "remote": ["work from home", "wfh", "anywhere", "remotely", "telecommute"],
+    "new york": ["new york city", "nyc"],
+    "san francisco": ["bay area", "san francisco bay area"],
+    "bengaluru": ["bangalore", "blr"],
+    "gurugram": ["gurgaon"],
+    "mumbai": ["bombay"],
+    "united states": ["usa", "u.s.", "u.s.a."],
+    "united kingdom": ["u.k.", "great britain"],
+}
+# Two-letter abbreviations that are also ordinary words ("la jolla", "contact us"); expanded
+# only in text known to be a location (normalize_terms(..., location=True))
+LOCATION_ABBREVIATIONS = {
+    "ny": "new york",
+    "la": "los angeles",
+    "sf": "san francisco",
+    "us": "united states",
+    "uk": "united kingdom",
+}
+_ALIAS_RE = re.compile(
+    r"(?<![\w.])(" + "|".join(
+        re.escape(alias) for alias in sorted(
+            (alias for aliases in LOCATION_ALIASES.values() for alias in aliases), key=len, reverse=True
+        )
+    ) + r")(?![\w])"
+)
+_ALIAS_LOOKUP = {alias: canonical for canonical, aliases in LOCATION_ALIASES.items() for alias in aliases}
+_ABBREVIATION_RE = re.compile(r"(?<![\w.])(" + "|".join(LOCATION_ABBREVIATIONS) + r")(?![\w.])")
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+_STOPWORDS = {"a", "an", "the", "in", "at", "for", "near", "of", "and", "or"}
+# Search operators that change the results: quoted phrases, site:/intitle:-style filters, -exclusions
+_OPERATOR_RE = re.compile(r'"[^"]*"|(?<!\S)(?:[a-z]+:\S+|-\S+)', re.IGNORECASE)
+_BOOLEAN_RE = re.compile(r"(?<!\S)(?:OR|AND|\|)(?!\S)")
+# Provider error text returned in place of results (e.g. Tavily returns repr(exception))
+_ERROR_TEXT_RE = re.compile(r"^\s*(?:error\b|exception\b|no good \w+ search result|\w*(?:error|exception)\()", re.IGNORECASE)
+
+
+def normalize_terms(text, location=False):
+    """
+    Canonicalize plain text into a sorted, de-duplicated token string.
+
+    Lower-cases, maps location aliases ("NYC" -> "new york", "WFH" -> "remote"),
+    drops stopwords and punctuation, singularizes "jobs" and sorts the tokens.
+
+    Args:
+        text (str): Text to normalize
+        location (bool): `text` is a location value, so LOCATION_ABBREVIATIONS
+            ("LA", "NY", "US") are expanded too
+    """
+    text = re.sub(r"\s+", " ", str(text).lower()).strip()
+    text = _ALIAS_RE.sub(lambda m: _ALIAS_LOOKUP[m.group(1)], text)
+    if location:
+        text = _ABBREVIATION_RE.sub(lambda m: LOCATION_ABBREVIATIONS[m.group(1)], text)
+    tokens = set()
+    for token in _TOKEN_RE.findall(text):
+        token = token.strip(".")
+        if not token or token in _STOPWORDS:
+            continue
+        tokens.add("job" if token == "jobs" else token)
+    return " ".join(sorted(tokens))
+
+
+def normalize_query(query):
+    """
+    Canonicalize a search query so equivalent searches share a cache entry.
+
+    Plain words are normalized with normalize_terms. Operators are kept verbatim, in
+    order, after them: quoted phrases, `site:`-style filters and `-term` exclusions. A
+    query using OR/AND is kept whole (whitespace collapsed), since word order matters there.
+    """
+    raw = re.sub(r"\s+", " ", str(query)).strip()
+    if _BOOLEAN_RE.search(raw):
+        return raw
+    operators = [match.group(0) for match in _OPERATOR_RE.finditer(raw)]
+    plain = normalize_terms(_OPERATOR_RE.sub(" ", raw))
+    return " ".join(part for part in [plain] + operators if part)
+
+
+def is_successful_result(result):
+    """
+    True for a non-empty search payload; False for empty results and for error text or
+    error payloads that providers return in place of results.
+    """
+    if not result:
+        return False
+    if isinstance(result, str):
+        try:
+            parsed = json.loads(result)
+        except ValueError:
+            return not _ERROR_TEXT_RE.match(result)
+        return is_successful_result(parsed) if isinstance(parsed, (dict, list)) else bool(parsed)
+    if isinstance(result, dict):
+        if result.get("error") or result.get("errors"):
+            return False
+        items = result.get("organic", result.get("results"))
+        return bool(items) if items is not None else True
+    return True
+
+
+class SearchCache:
+    """
+    Disk-backed TTL cache for web search results, stored under DataManager's cache directory.
+
+    Entries are fresh for the provider's TTL. For a further `stale_ttl` seconds they are
+    still served, while a background refresh fetches a new copy (stale-while-revalidate).
+    The least recently used entries are evicted beyond `max_items`.
+    """
+
+    def __init__(self, cache_dir=None, ttls=None, default_ttl=SEARCH_CACHE_DEFAULT_TTL,
+                 stale_ttl=SEARCH_CACHE_STALE_TTL, max_items=SEARCH_CACHE_MAX_ITEMS):
+        """
+        Args:
+            cache_dir (str, optional): Defaults to <DataManager cache>/search
+            ttls (dict, optional): provider -> fresh TTL in seconds
+            default_ttl (int): TTL for providers missing from `ttls`
+            stale_ttl (int): Extra seconds an expired entry may be served while refreshing
+            max_items (int): Maximum number of cached searches
+        """
+        if cache_dir is None:
+            cache_dir = DataManager().base_dir / "cache" / "search"
+        self.cache_dir = str(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.ttls = dict(SEARCH_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.max_items = max_items
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-cache-refresh")
+        # key -> last access time, oldest first (rebuilt from file mtimes on startup)
+        self._index = OrderedDict(
+            (entry.name[:-5], entry.stat().st_mtime)
+            for entry in sorted(os.scandir(self.cache_dir), key=lambda e: e.stat().st_mtime)
+            if entry.name.endswith(".json")
+        )
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(provider, query, params=None):
+        """Hash the provider, normalized query and any extra call parameters."""
+        payload = json.dumps(
+            {"provider": provider, "query": normalize_query(query), "params": params or {}},
+            sort_keys=True, default=str,
+        )
+        return f"{provider}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, provider, key):
+        """
+        Look up a cached search.
+
+        Returns:
+            tuple: (result, state) where state is "fresh", "stale" or "miss"
+        """
+        entry = self._read(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None, "miss"
+
+        age = time.time() - entry.get("stored_at", 0)
+        ttl = self.ttls.get(provider, self.default_ttl)
+        if age <= ttl:
+            state = "fresh"
+        elif age <= ttl + self.stale_ttl:
+            state = "stale"
+        else:
+            with self._lock:
+                self.misses += 1
+            return None, "miss"
+
+        with self._lock:
+            self._index[key] = time.time()
+            self._index.move_to_end(key)
+            if state == "fresh":
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        return entry.get("result"), state
+
+    def set(self, key, result):
+        """Store a search result, evicting least recently used entries beyond max_items."""
+        tmp_path = self._path(key) + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": time.time(), "result": result}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            print("Error writing search cache:", e)
+            return
+
+        with self._lock:
+            self._index[key] = time.time()
+            self._index.move_to_end(key)
+            evicted = []
+            while len(self._index) > self.max_items:
+                evicted.append(self._index.popitem(last=False)[0])
+            self.evictions += len(evicted)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def refresh_async(self, key, fetch):
+        """Re-run `fetch` in the background and store its result; at most one refresh per key."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _refresh():
+            try:
+                result = fetch()
+                if is_successful_result(result):
+                    self.set(key, result)
+            except Exception as e:
+                print(f"Background search refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(_refresh)
+
+    def fetch(self, provider, query, fetch, params=None):
+        """
+        Return a cached result for (provider, query), calling `fetch()` on a miss.
+        Only successful, non-empty results are cached (see is_successful_result).
+        """
+        key = self.make_key(provider, query, params)
+        result, state = self.get(provider, key)
+        if state == "stale":
+            self.refresh_async(key, fetch)
+        if state != "miss":
+            return result
+        result = fetch()
+        if is_successful_result(result):
+            self.set(key, result)
+        return result
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached searches."""
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """Return the process-wide SearchCache, or None when SEARCH_CACHE_ENABLED is off."""
+    global _shared_cache
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = SearchCache()
+    return _shared_cache
+
+
+def cached_search(provider):
+    """
+    Decorator for search tool `_run` methods: serves repeated queries from the SearchCache.
+
+    The query is taken from the first positional argument or a `query`/`search_query`
+    keyword; any other keyword arguments become part of the cache key.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = get_search_cache()
+            params = dict(kwargs)
+            query = args[0] if args else params.pop("query", None) or params.pop("search_query", None)
+            if cache is None or not query:
+                return func(self, *args, **kwargs)
+            return cache.fetch(provider, query, lambda: func(self, *args, **kwargs), params=params)
+        return wrapper
+    return decorator
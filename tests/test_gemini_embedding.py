@@ -0,0 +1,144 @@
+# tests/test_gemini_embedding.py
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from services.llm_service import GeminiEmbeddingPlugin
+
+
+class StubEmbeddingServer:
+    """
+    Local HTTP server standing in for the embedding endpoint. Each request pops the next
+    scripted reply: an HTTP status, {"status", "headers"}, or {"delay": seconds} before a 200.
+    Once the script runs out every request succeeds.
+    """
+
+    def __init__(self, script=()):
+        self.script = list(script)
+        self.requests = []
+        self.client_ports = set()
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    stub.requests.append(body)
+                    stub.client_ports.add(self.client_address[1])
+                    step = stub.script.pop(0) if stub.script else 200
+                if isinstance(step, int):
+                    step = {"status": step}
+                if step.get("delay"):
+                    time.sleep(step["delay"])
+                status = step.get("status", 200)
+                if status == 200:
+                    texts = body.get("texts") or [body.get("text")]
+                    payload = {"embeddings": [[float(len(text)), 1.0] for text in texts]}
+                    if "text" in body:
+                        payload = {"embedding": payload["embeddings"][0]}
+                else:
+                    payload = {"error": status}
+                data = json.dumps(payload).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    for name, value in step.get("headers", {}).items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client already gave up on a delayed reply
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/embed"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def live_provider_mode(monkeypatch):
+    monkeypatch.setenv("PROVIDER_MODE", "live")
+
+
+def make_plugin(url, **kwargs):
+    kwargs.setdefault("timeout", (1.0, 0.5))
+    kwargs.setdefault("max_retries", 3)
+    kwargs.setdefault("backoff_factor", 0.01)
+    return GeminiEmbeddingPlugin("models/test", "test-deployment", "test-key", url, **kwargs)
+
+
+def test_retries_server_errors_then_succeeds():
+    with StubEmbeddingServer([503, 500]) as server:
+        plugin = make_plugin(server.url)
+        assert plugin.embed("abc") == [3.0, 1.0]
+    assert len(server.requests) == 3
+
+
+def test_honours_retry_after_on_429():
+    with StubEmbeddingServer([{"status": 429, "headers": {"Retry-After": "0"}}]) as server:
+        plugin = make_plugin(server.url, backoff_factor=10)  # jittered backoff would take seconds
+        started = time.monotonic()
+        assert plugin.embed_batch(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert time.monotonic() - started < 2
+    assert len(server.requests) == 2
+
+
+def test_retries_read_timeout():
+    with StubEmbeddingServer([{"delay": 1.5}]) as server:
+        plugin = make_plugin(server.url, timeout=(1.0, 0.3))
+        started = time.monotonic()
+        assert plugin.embed("abcd") == [4.0, 1.0]
+    assert time.monotonic() - started < 1.5
+    assert len(server.requests) == 2
+
+
+def test_gives_up_after_max_retries():
+    with StubEmbeddingServer([503] * 10) as server:
+        plugin = make_plugin(server.url, max_retries=2)
+        with pytest.raises(requests.HTTPError):
+            plugin._post({"text": "x"})
+    assert len(server.requests) == 3
+
+
+def test_does_not_retry_client_errors():
+    with StubEmbeddingServer([400]) as server:
+        plugin = make_plugin(server.url)
+        assert plugin.embed("x") is None
+    assert len(server.requests) == 1
+
+
+def test_timeout_exhausts_retries():
+    with StubEmbeddingServer([{"delay": 1.0}] * 3) as server:
+        plugin = make_plugin(server.url, timeout=(1.0, 0.2), max_retries=1)
+        with pytest.raises(requests.Timeout):
+            plugin._post({"text": "x"})
+    assert len(server.requests) == 2
+
+
+def test_reuses_pooled_connection():
+    with StubEmbeddingServer() as server:
+        plugin = make_plugin(server.url)
+        matrix = plugin.embed_many([f"text {i}" for i in range(10)], batch_size=2)
+    assert matrix.shape == (10, 2)
+    assert len(server.requests) == 5
+    assert len(server.client_ports) == 1
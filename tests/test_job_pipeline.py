@@ -0,0 +1,41 @@
+# tests/test_job_pipeline.py
+import pytest
+
+from services.job_pipeline import parse_search_result
+
+
+def parse(title, url="https://www.linkedin.com/jobs/view/123456", location=""):
+    return parse_search_result({"title": title, "url": url, "snippet": ""}, location=location)
+
+
+@pytest.mark.parametrize("title, url", [
+    ("Front-end Developer Jobs in Pune - 2,345 openings | Naukri", "https://www.naukri.com/front-end-developer-jobs-in-pune"),
+    ("500+ Python Developer jobs in Bangalore (24 new)", "https://in.linkedin.com/jobs/python-developer-jobs-bangalore"),
+    ("Python Developer Jobs, Employment in Remote | Indeed.com", "https://www.indeed.com/q-python-developer-l-remote-jobs.html"),
+    ("Python Developer", "https://www.indeed.com/jobs?q=python+developer&l=pune"),
+    ("React Developer", "https://www.linkedin.com/jobs/search?keywords=react"),
+])
+def test_listing_pages_are_skipped(title, url):
+    assert parse(title, url) is None
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Front-end Developer - Remote", ("Front-end Developer", "", "Remote")),
+    ("Python Developer - Pune - Acme", ("Python Developer", "Acme", "Pune")),
+    ("Data Engineer at Bengaluru", ("Data Engineer", "", "Bengaluru")),
+    ("Acme hiring Python Developer in Pune", ("Python Developer", "Acme", "Pune")),
+    ("Python Developer - Acme | LinkedIn", ("Python Developer", "Acme", "")),
+])
+def test_location_words_are_not_companies(title, expected):
+    job = parse(title)
+    assert (job["title"], job["company"], job["location"]) == expected
+
+
+def test_searched_location_is_not_a_company():
+    job = parse("Backend Engineer - Kharadi", location="Kharadi, Pune")
+    assert (job["company"], job["location"]) == ("", "Kharadi")
+
+
+def test_company_falls_back_to_employer_host():
+    job = parse("Backend Engineer - Remote", url="https://careers.acme.com/jobs/42")
+    assert (job["company"], job["location"]) == ("Acme", "Remote")
@@ -0,0 +1,68 @@
+# tests/test_job_vectors.py
+import os
+
+import numpy as np
+
+from services.job_vectors import JobVectorIndex
+
+
+class FakeEmbeddings:
+    """Deterministic stand-in for LLMService: a normalized two-dim vector per text."""
+
+    model_id = "fake-model"
+
+    def get_embedding(self):
+        return self
+
+    def embed_texts(self, texts):
+        vectors = np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_job(n, **fields):
+    return dict({"title": f"Engineer {n}", "company": "Acme", "url": f"https://example.com/jobs/{n}"}, **fields)
+
+
+def test_reload_restores_saved_jobs(tmp_path):
+    index = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    index.add_jobs([make_job(1), make_job(22)])
+
+    reloaded = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    assert reloaded.ids == index.ids
+    assert reloaded.jobs == index.jobs
+    assert np.array_equal(reloaded.matrix, index.matrix)
+
+
+def test_save_appends_instead_of_rewriting(tmp_path):
+    index = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    index.add_jobs([make_job(1), make_job(2)])
+    vectors_path = tmp_path / JobVectorIndex.VECTOR_FILE
+    before = vectors_path.read_bytes()
+
+    index.add_jobs([make_job(1), make_job(3)])
+    after = vectors_path.read_bytes()
+    assert after.startswith(before)
+    assert len(after) - len(before) == index.matrix.shape[1] * 4  # one new float32 row
+
+
+def test_refreshed_metadata_survives_reload(tmp_path):
+    index = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    index.add_jobs([make_job(1)])
+    index.add_jobs([make_job(1, location="Pune")])
+
+    reloaded = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    assert len(reloaded) == 1
+    assert reloaded.jobs[0]["location"] == "Pune"
+
+
+def test_interrupted_append_keeps_complete_rows(tmp_path):
+    index = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    index.add_jobs([make_job(1), make_job(2)])
+    with open(tmp_path / JobVectorIndex.VECTOR_FILE, "ab") as f:
+        f.write(np.ones(2, dtype=np.float32).tobytes())  # a vector row without its record
+    with open(tmp_path / JobVectorIndex.JOBS_FILE, "a", encoding="utf-8") as f:
+        f.write('{"id": "torn')
+
+    reloaded = JobVectorIndex(str(tmp_path), llm=FakeEmbeddings())
+    assert reloaded.ids == index.ids
+    assert os.path.getsize(tmp_path / JobVectorIndex.VECTOR_FILE) == index.matrix.nbytes
@@ -0,0 +1,28 @@
+# tests/test_search_cache.py
+import pytest
+
+from services.search_cache import normalize_query, normalize_terms
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("la jolla python jobs", "job jolla la python"),
+    ("contact us for jobs", "contact job us"),
+    ("python jobs NYC", "job new python york"),
+    ("WFH python jobs", "job python remote"),
+])
+def test_query_aliases(query, expected):
+    assert normalize_query(query) == expected
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("LA", "angeles los"),
+    ("New York, NY", "new york"),
+    ("US", "states united"),
+])
+def test_abbreviations_expand_only_in_locations(location, expected):
+    assert normalize_terms(location, location=True) == expected
+    assert normalize_terms(location) != expected
+
+
+def test_operators_are_kept_verbatim():
+    assert normalize_query('python jobs "la jolla" site:lever.co -senior') == 'job python "la jolla" site:lever.co -senior'
@@ -0,0 +1,85 @@
+# tests/test_skill_matcher.py
+import pytest
+
+from tools.skill_matcher import SkillMatcher, get_skill_matcher, skill_gap
+
+
+@pytest.mark.parametrize("text", [
+    "I excel at communication with stakeholders",
+    "Known for swift delivery of features",
+    "Worked in an agile team of five",
+    "Each network node reports its status",
+    "Ready to go to market in Q3",
+    "Able to react to feedback quickly",
+    "Brought a spark of creativity",
+    "Great attention to detail in every spring release cycle",
+    "Carried the torch for code quality",
+    "Added 5 ml of reagent",
+    "The ts column holds timestamps",
+    "a git repository",
+])
+def test_ordinary_words_in_prose_are_not_skills(text):
+    assert get_skill_matcher().find_skills(text) == set()
+
+
+@pytest.mark.parametrize("text", [
+    "Software Intern - Spring 2025",
+    "Software Intern - Spring",
+    "Owned the Go-to-market plan",
+    "Worked in the R&D lab",
+    "Excel at building relationships",
+    "React quickly to incidents",
+    "Spark joy in the team",
+    "Swift onboarding for new hires",
+    "Rust belt manufacturing client",
+    "Agile and curious learner",
+])
+def test_capitalized_prose_is_not_skills(text):
+    assert get_skill_matcher().find_skills(text) == set()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Swift, Kotlin", {"Swift", "Kotlin"}),
+    ("Built services in Node and Express", {"Node.js", "Express"}),
+    ("Tools: Excel, Tableau", {"Excel", "Tableau"}),
+    ("Languages: Go, R", {"Go", "R"}),
+    ("Senior Swift developer", {"Swift"}),
+    ("Automated reports with Excel macros", {"Excel"}),
+    ("React and TypeScript apps", {"React", "TypeScript"}),
+    ("Built it in Node and Express. Excel at communication", {"Node.js", "Express"}),
+])
+def test_exact_case_forms_match_in_tech_context(text, expected):
+    assert get_skill_matcher().find_skills(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("python, excel, sql", {"Python", "Excel", "SQL"}),
+    ("- git\n- docker", {"Git", "Docker"}),
+    ("skills: go | r | rust", {"Go", "R", "Rust"}),
+    ("swift", {"Swift"}),
+])
+def test_lower_case_forms_match_as_list_items(text, expected):
+    assert get_skill_matcher().find_skills(text) == expected
+
+
+def test_unambiguous_synonyms_match_case_insensitively():
+    found = get_skill_matcher().find_skills("Used NODEJS, PyTorch and microsoft excel with github actions")
+    assert found == {"Node.js", "PyTorch", "Excel", "Git", "CI/CD"}
+
+
+def test_matches_respect_word_boundaries():
+    matcher = get_skill_matcher()
+    assert matcher.find_skills("javascript") == {"JavaScript"}
+    assert matcher.find_skills("node-based tooling") == set()
+
+
+def test_prose_does_not_inflate_skill_gap():
+    job = {"title": "Backend Engineer", "snippet": "You excel in an agile team and ship swift fixes with Python"}
+    gap = skill_gap({"Python"}, job)
+    assert gap == {"matched_skills": ["Python"], "missing_skills": [], "skill_overlap": 1.0}
+
+
+def test_custom_case_sensitive_skill_name_is_not_matched_lower_case():
+    matcher = SkillMatcher(taxonomy={"Go": ["golang"]}, case_sensitive={"Go": ["Go"]})
+    assert matcher.find_skills("let's go") == set()
+    assert matcher.find_skills("golang services") == {"Go"}
@@ -0,0 +1,71 @@
+# tools/docx_extractor.py
+import io
+import zipfile
+import xml.etree.ElementTree as ET
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P, _T, _TAB, _BR, _CR = _W + "p", _W + "t", _W + "tab", _W + "br", _W + "cr"
+_TBL, _TR, _TC = _W + "tbl", _W + "tr", _W + "tc"
+
+
+def iter_docx_text(source):
+    """
+    Stream text out of a DOCX without building the python-docx document model.
+
+    Only word/document.xml is read from the zip (embedded media is never decoded), and it
+    is parsed incrementally, so memory stays flat regardless of document size.
+    Body paragraphs are yielded one per item; each table row is yielded as its cell
+    texts joined by " | " (nested tables are flattened into their enclosing cell).
+
+    Args:
+        source (str | bytes | file-like): Path to the .docx, its raw bytes, or a binary stream
+
+    Yields:
+        str: Non-empty paragraph or table-row text, in document order
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    with zipfile.ZipFile(source) as archive, archive.open("word/document.xml") as xml_file:
+        paragraph = []
+        rows = []   # stack of cell-text lists, one per open table row
+        cells = []  # stack of paragraph-text lists, one per open table cell
+
+        for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == _TR:
+                    rows.append([])
+                elif tag == _TC:
+                    cells.append([])
+                continue
+
+            if tag == _T:
+                if elem.text:
+                    paragraph.append(elem.text)
+            elif tag == _TAB:
+                paragraph.append("\t")
+            elif tag in (_BR, _CR):
+                paragraph.append("\n")
+            elif tag == _P:
+                text = "".join(paragraph).strip()
+                paragraph = []
+                elem.clear()
+                if cells:
+                    if text:
+                        cells[-1].append(text)
+                elif text:
+                    yield text
+            elif tag == _TC:
+                cell_text = " ".join(cells.pop())
+                if rows:
+                    rows[-1].append(cell_text)
+            elif tag == _TR:
+                row_text = " | ".join(cell for cell in rows.pop() if cell)
+                if cells:
+                    if row_text:
+                        cells[-1].append(row_text)
+                elif row_text:
+                    yield row_text
+            elif tag == _TBL:
+                elem.clear()
@@ -0,0 +1,257 @@
+# tools/federated_search.py
+import json
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from crewai.tools import BaseTool
+from utils.job_dedup import canonical_url
+from config.config import (
+    SERPER_API_KEY, TAVILY_API_KEY, SEARCH_PROVIDERS, SEARCH_QUORUM, SEARCH_DEADLINE,
+    SEARCH_HEDGE_PERCENTILE, SEARCH_HEDGE_DELAY, SEARCH_MAX_RESULTS,
+)
+
+# Minimum latency samples before the observed percentile replaces SEARCH_HEDGE_DELAY
+MIN_LATENCY_SAMPLES = 5
+# Calls faster than this were served from the search cache and say nothing about provider latency
+MIN_NETWORK_LATENCY = 0.05
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies for one provider."""
+
+    def __init__(self, window=50):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p):
+        """Return the p-th percentile (0-1) of recent latencies, or None with too few samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+
+def normalize_results(provider, raw):
+    """
+    Convert one provider's raw output into a list of {"title", "url", "snippet", "source"} dicts.
+
+    Handles Serper's {"organic": [...]} payload, Tavily's list of {"url", "content"} dicts,
+    and plain-text output (DuckDuckGo), which becomes a single snippet-only result.
+    """
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            text = raw.strip()
+            return [{"title": "", "url": "", "snippet": text, "source": provider}] if text else []
+
+    if isinstance(raw, dict):
+        raw = raw.get("organic") or raw.get("results") or []
+    results = []
+    for item in raw if isinstance(raw, list) else []:
+        if not isinstance(item, dict):
+            continue
+        results.append({
+            "title": (item.get("title") or "").strip(),
+            "url": (item.get("link") or item.get("url") or "").strip(),
+            "snippet": (item.get("snippet") or item.get("content") or item.get("description") or "").strip(),
+            "source": provider,
+        })
+    return [result for result in results if result["url"] or result["snippet"]]
+
+
+def merge_results(results_by_provider, providers, max_results=SEARCH_MAX_RESULTS):
+    """
+    Interleave provider results by rank (in `providers` priority order) and drop duplicate URLs.
+    A duplicate's provider is added to the kept result's "sources" list.
+    """
+    merged = []
+    by_url = {}
+    lists = [results_by_provider.get(name, []) for name in providers]
+    for rank in range(max((len(items) for items in lists), default=0)):
+        for items in lists:
+            if rank >= len(items):
+                continue
+            item = dict(items[rank])
+            key = canonical_url(item["url"])
+            if key and key in by_url:
+                sources = by_url[key]["sources"]
+                if item["source"] not in sources:
+                    sources.append(item["source"])
+                continue
+            item["sources"] = [item["source"]]
+            if key:
+                by_url[key] = item
+            merged.append(item)
+    return merged[:max_results]
+
+
+class FederatedSearch:
+    """
+    Query several search providers concurrently and merge their results.
+
+    Each provider gets a hedged backup request if it is slower than its own
+    SEARCH_HEDGE_PERCENTILE latency; the search returns as soon as `quorum` providers
+    have produced results with a URL, or at the deadline with whatever has arrived.
+    (DuckDuckGo's snippet-only text does not count toward the quorum.)
+    Slow calls are left to finish in the background rather than waited on.
+    """
+
+    def __init__(self, providers=None, quorum=SEARCH_QUORUM, deadline=SEARCH_DEADLINE,
+                 hedge_percentile=SEARCH_HEDGE_PERCENTILE, hedge_delay=SEARCH_HEDGE_DELAY):
+        """
+        Args:
+            providers (dict, optional): name -> callable(query) returning raw results,
+                in priority order. Defaults to the configured SEARCH_PROVIDERS.
+            quorum (int): Providers with URL results needed before returning early
+            deadline (float): Maximum seconds to wait for providers
+            hedge_percentile (float): Latency percentile (0-1) after which a backup request is sent
+            hedge_delay (float): Hedge delay used until enough latencies have been observed
+        """
+        self.providers = providers if providers is not None else self._default_providers()
+        self.quorum = max(1, min(quorum, len(self.providers) or 1))
+        self.deadline = deadline
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self.latency = {name: LatencyTracker() for name in self.providers}
+        # Room for a primary and a hedge per provider, with headroom for calls outliving a deadline
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, 4 * len(self.providers)), thread_name_prefix="federated-search"
+        )
+
+    @staticmethod
+    def _default_providers():
+        from tools.web_search import DuckDuckGoSearchTool, TavilySearchTool, SerperSearchTool
+
+        factories = {
+            "serper": lambda: (lambda query: SerperSearchTool()._run(search_query=query)) if SERPER_API_KEY else None,
+            "tavily": lambda: (TavilySearchTool(tavily_api_key=TAVILY_API_KEY)._run if TAVILY_API_KEY else None),
+            "duckduckgo": lambda: DuckDuckGoSearchTool()._run,
+        }
+        providers = {}
+        for name in SEARCH_PROVIDERS:
+            if name not in factories:
+                print(f"Unknown search provider: {name}")
+                continue
+            try:
+                call = factories[name]()
+            except Exception as e:
+                print(f"Search provider {name} unavailable: {e}")
+                continue
+            if call is not None:
+                providers[name] = call
+        return providers
+
+    def _hedge_after(self, name):
+        observed = self.latency[name].percentile(self.hedge_percentile)
+        return observed if observed is not None else self.hedge_delay
+
+    def _call(self, name, query):
+        started = time.perf_counter()
+        raw = self.providers[name](query)
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_NETWORK_LATENCY:
+            self.latency[name].record(elapsed)
+        return normalize_results(name, raw), elapsed
+
+    def search(self, query, quorum=None, deadline=None):
+        """
+        Run `query` against all providers concurrently.
+
+        Args:
+            query (str): Search query
+            quorum (int, optional): Override the instance quorum
+            deadline (float, optional): Override the instance deadline in seconds
+
+        Returns:
+            dict: {"results": merged list, "providers": per-provider status, "elapsed": seconds}
+        """
+        quorum = self.quorum if quorum is None else max(1, min(quorum, len(self.providers) or 1))
+        deadline = self.deadline if deadline is None else deadline
+        started = time.monotonic()
+
+        inflight = {}
+        status = {name: {"status": "pending", "hedged": False} for name in self.providers}
+        for name in self.providers:
+            inflight[self._executor.submit(self._call, name, query)] = name
+        hedge_at = {name: started + self._hedge_after(name) for name in self.providers}
+        results = {}
+
+        while inflight:
+            now = time.monotonic()
+            if now - started >= deadline:
+                break
+            # Fire backup requests for providers past their hedge point
+            for name, due in list(hedge_at.items()):
+                if now >= due and status[name]["status"] == "pending":
+                    inflight[self._executor.submit(self._call, name, query)] = name
+                    status[name]["hedged"] = True
+                    del hedge_at[name]
+            next_event = min([started + deadline] + list(hedge_at.values()))
+            done, _ = wait(list(inflight), timeout=max(0.0, next_event - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = inflight.pop(future)
+                if status[name]["status"] != "pending":
+                    continue  # the other copy of a hedged call already finished
+                hedge_at.pop(name, None)
+                siblings = [f for f, other in inflight.items() if other == name]
+                try:
+                    items, elapsed = future.result()
+                except Exception as e:
+                    if siblings:
+                        continue  # the hedge may still succeed
+                    status[name] = {**status[name], "status": "error", "error": str(e)}
+                    continue
+                for sibling in siblings:
+                    sibling.cancel()
+                    inflight.pop(sibling)
+                results[name] = items
+                status[name] = {**status[name], "status": "ok", "latency": round(elapsed, 3), "count": len(items)}
+
+            # Only linked results are usable job hits; a url-less text blob must not end the search
+            if sum(1 for items in results.values() if any(item["url"] for item in items)) >= quorum:
+                break
+
+        for name, info in status.items():
+            if info["status"] == "pending":
+                info["status"] = "timeout"
+
+        return {
+            "results": merge_results(results, list(self.providers)),
+            "providers": status,
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+
+
+_shared_search = None
+_shared_search_lock = threading.Lock()
+
+
+def get_federated_search():
+    """Return the process-wide FederatedSearch, creating it on first use."""
+    global _shared_search
+    if _shared_search is None:
+        with _shared_search_lock:
+            if _shared_search is None:
+                _shared_search = FederatedSearch()
+    return _shared_search
+
+
+class FederatedSearchTool(BaseTool):
+    name: str = "federated_search_tool"
+    description: str = (
+        "Search the web with all configured search engines at once. "
+        "Returns a JSON list of results with title, url, snippet and sources."
+    )
+
+    def _run(self, query: str) -> str:
+        """Run the query through the shared FederatedSearch and return the merged results as JSON."""
+        return json.dumps(get_federated_search().search(query)["results"], ensure_ascii=False)
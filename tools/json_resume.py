@@ -0,0 +1,154 @@
+# tools/json_resume.py
+import json
+
+# Maps structured resume uploads (https://jsonresume.org/schema or our own parsed_resume.json)
+# straight into the internal resume structure, so only derived fields need the LLM.
+
+INTERNAL_KEYS = {"personal_info", "experience", "education", "skills", "projects"}
+JSON_RESUME_KEYS = {"basics", "work", "education", "skills", "projects"}
+DERIVED_KEYS = ("ats_score", "match_recommendations")
+
+
+def _load(content):
+    if isinstance(content, dict):
+        return content
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def detect_structured_resume(content):
+    """
+    Identify structured resume JSON.
+
+    Returns:
+        str | None: "internal", "json_resume", or None for anything else
+    """
+    data = _load(content)
+    if data is None:
+        return None
+    keys = set(data)
+    if "personal_info" in keys and len(keys & INTERNAL_KEYS) >= 2:
+        return "internal"
+    if "basics" in keys and isinstance(data["basics"], dict) and len(keys & JSON_RESUME_KEYS) >= 2:
+        return "json_resume"
+    return None
+
+
+def _duration(item):
+    start, end = item.get("startDate", ""), item.get("endDate", "")
+    if not start and not end:
+        return ""
+    return f"{start} - {end or 'Present'}".strip(" -")
+
+
+def _location(location):
+    if isinstance(location, str):
+        return location
+    if not isinstance(location, dict):
+        return ""
+    parts = [location.get("city"), location.get("region"), location.get("countryCode")]
+    return ", ".join(part for part in parts if part)
+
+
+def _skill_category(name):
+    name = (name or "").lower()
+    if "language" in name:
+        return "languages"
+    if "framework" in name or "librar" in name:
+        return "frameworks"
+    if "cloud" in name or "devops" in name:
+        return "cloud"
+    if "tool" in name:
+        return "tools"
+    return "other"
+
+
+def map_json_resume(data):
+    """
+    Convert a JSON Resume document into the internal resume structure.
+
+    Args:
+        data (dict): Parsed JSON Resume
+
+    Returns:
+        dict: Internal structure (only sections that have content)
+    """
+    basics = data.get("basics") or {}
+    personal_info = {
+        "name": basics.get("name", ""),
+        "email": basics.get("email", ""),
+        "phone": basics.get("phone", ""),
+        "location": _location(basics.get("location")),
+    }
+    for profile in basics.get("profiles") or []:
+        network = (profile.get("network") or "").lower()
+        if network in ("linkedin", "github"):
+            personal_info[network] = profile.get("url") or profile.get("username", "")
+
+    skills = {}
+    for group in data.get("skills") or []:
+        keywords = group.get("keywords") or ([group["name"]] if group.get("name") else [])
+        skills.setdefault(_skill_category(group.get("name")), []).extend(keywords)
+
+    result = {
+        "personal_info": {key: value for key, value in personal_info.items() if value},
+        "summary": basics.get("summary") or basics.get("label", ""),
+        "skills": skills,
+        "experience": [
+            {
+                "title": job.get("position", ""),
+                "company": job.get("name") or job.get("company", ""),
+                "location": _location(job.get("location")),
+                "duration": _duration(job),
+                "responsibilities": ([job["summary"]] if job.get("summary") else []) + list(job.get("highlights") or []),
+            }
+            for job in data.get("work") or []
+        ],
+        "projects": [
+            {
+                "title": project.get("name", ""),
+                "duration": _duration(project),
+                "description": ([project["description"]] if project.get("description") else [])
+                + list(project.get("highlights") or []),
+            }
+            for project in data.get("projects") or []
+        ],
+        "education": [
+            {
+                "degree": school.get("studyType", ""),
+                "major": school.get("area", ""),
+                "institution": school.get("institution", ""),
+                "year": (school.get("endDate") or school.get("startDate") or "")[:4],
+                "cgpa_or_percentage": school.get("score", ""),
+            }
+            for school in data.get("education") or []
+        ],
+        "certifications": [
+            {"name": cert.get("name", ""), "organization": cert.get("issuer", "")}
+            for cert in data.get("certificates") or []
+        ],
+        "publications": [
+            {"title": pub.get("name", ""), "contributions": [pub["summary"]] if pub.get("summary") else []}
+            for pub in data.get("publications") or []
+        ],
+    }
+    return {key: value for key, value in result.items() if value}
+
+
+def map_structured_resume(content):
+    """
+    Map structured resume JSON (text or dict) into the internal structure.
+
+    Returns:
+        dict | None: Internal structure, or None if `content` is not a recognized format
+    """
+    kind = detect_structured_resume(content)
+    if kind is None:
+        return None
+    data = _load(content)
+    if kind == "json_resume":
+        return map_json_resume(data)
+    return dict(data)
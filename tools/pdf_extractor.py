@@ -0,0 +1,162 @@
+# tools/pdf_extractor.py
+import io
+import os
+import time
+import signal
+import threading
+import multiprocessing
+from contextlib import contextmanager
+
+import PyPDF2
+
+from config.config import (
+    PDF_MAX_PAGES,
+    PDF_MAX_CHARS,
+    PDF_EXTRACT_TIMEOUT,
+    PDF_PARALLEL_MIN_PAGES,
+    PDF_MAX_WORKERS,
+)
+from utils.text_normalizer import PAGE_BREAK
+
+# Per-worker PdfReader, opened once by the pool initializer and reused for every page task.
+_worker_reader = None
+
+
+def _open_reader(source):
+    """Open a PdfReader from a file path or from in-memory bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return PyPDF2.PdfReader(io.BytesIO(source))
+    return PyPDF2.PdfReader(source)
+
+
+def _init_worker(source):
+    global _worker_reader
+    _worker_reader = _open_reader(source)
+
+
+def _extract_page(index):
+    return _worker_reader.pages[index].extract_text() or ""
+
+
+class _PageTimeout(Exception):
+    pass
+
+
+def _can_alarm():
+    """SIGALRM timers only work on the main thread, and not on Windows."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def _alarm(seconds):
+    """Raise _PageTimeout in the enclosed block once `seconds` have passed (no-op where unsupported)."""
+    if not _can_alarm():
+        yield
+        return
+
+    def _expire(signum, frame):
+        raise _PageTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, max(seconds, 0.001))
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _extract_serial(reader, page_count, max_chars, timeout):
+    """Read pages in this process under one `timeout` alarm; a page still running when it fires is abandoned."""
+    page_texts = []
+    total = 0
+    try:
+        with _alarm(timeout):
+            for page in reader.pages[:page_count]:
+                page_texts.append(page.extract_text() or "")
+                total += len(page_texts[-1])
+                if total >= max_chars:
+                    break
+    except _PageTimeout:
+        skipped = list(range(len(page_texts) + 1, page_count + 1))
+        if skipped:
+            print(f"PDF extraction exceeded {timeout}s; skipped pages {skipped}.")
+    return _join_within_budget(page_texts, max_chars)
+
+
+def extract_pdf_text(source, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS,
+                     timeout=PDF_EXTRACT_TIMEOUT, parallel_min_pages=PDF_PARALLEL_MIN_PAGES,
+                     max_workers=PDF_MAX_WORKERS):
+    """
+    Extract text from a PDF, one page per form-feed separated block.
+
+    Small documents are read serially; documents with more than `parallel_min_pages`
+    pages are split across a process pool. Extraction stops at `max_pages` pages or
+    `max_chars` characters. The whole document shares one `timeout` deadline: pages
+    not finished by then are skipped. Serially, a SIGALRM timer interrupts the page being
+    read; in the pool, the worker processes are terminated, so a pathological page cannot
+    leave a busy process behind. Where no timer is available (off the main thread) small
+    documents use the pool too.
+
+    Args:
+        source (str | bytes): Path to the PDF or its raw bytes
+        max_pages (int): Maximum number of pages to read
+        max_chars (int): Stop once this many characters have been collected
+        timeout (float): Time budget in seconds for all pages
+        parallel_min_pages (int): Page count above which the process pool is used
+        max_workers (int, optional): Process pool size (defaults to the CPU count)
+
+    Returns:
+        str: Extracted text, pages separated by PAGE_BREAK
+    """
+    if isinstance(source, memoryview):
+        source = source.tobytes()
+    reader = _open_reader(source)
+    page_count = min(len(reader.pages), max_pages)
+
+    # Already inside a worker process (e.g. bulk ingestion): don't nest another pool.
+    if multiprocessing.parent_process() is not None or (page_count <= parallel_min_pages and _can_alarm()):
+        return _extract_serial(reader, page_count, max_chars, timeout)
+
+    workers = min(max_workers or os.cpu_count() or 1, page_count)
+    # multiprocessing.Pool rather than ProcessPoolExecutor: terminate() can stop a worker
+    # that is stuck inside a page, which executor shutdown cannot.
+    pool = multiprocessing.Pool(processes=workers, initializer=_init_worker, initargs=(source,))
+    try:
+        pending = [pool.apply_async(_extract_page, (index,)) for index in range(page_count)]
+        deadline = time.monotonic() + timeout
+
+        def _results():
+            timed_out = []
+            for index, result in enumerate(pending):
+                try:
+                    # Past the deadline this only collects pages that are already done
+                    yield result.get(timeout=max(0.0, deadline - time.monotonic()))
+                except multiprocessing.TimeoutError:
+                    timed_out.append(index + 1)
+                    yield ""
+                except Exception as e:
+                    print(f"Error extracting PDF page {index + 1}:", e)
+                    yield ""
+            if timed_out:
+                print(f"PDF extraction exceeded {timeout}s; skipped pages {timed_out}.")
+
+        return _join_within_budget(_results(), max_chars)
+    finally:
+        # Stop workers still busy on pages past the budget or stuck on a pathological page.
+        pool.terminate()
+        pool.join()
+
+
+def _join_within_budget(page_texts, max_chars):
+    parts = []
+    total = 0
+    for page_text in page_texts:
+        if not page_text:
+            continue
+        if total + len(page_text) >= max_chars:
+            parts.append(page_text[:max_chars - total])
+            break
+        parts.append(page_text)
+        total += len(page_text) + len(PAGE_BREAK)
+    return PAGE_BREAK.join(parts)
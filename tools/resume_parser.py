@@ -1,11 +1,90 @@
+import io
 import os
-import re
 import json
-import PyPDF2
-from docx import Document
+import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from services.llm_service import LLMService
+from services.llm_service import get_llm_service
+from utils.json_stream import IncrementalJSONAssembler
+from utils.json_decoder import extract_json, LLMJSONDecodeError
+from utils.text_normalizer import compact_resume_text, minify_json
+from tools.pdf_extractor import extract_pdf_text
+from tools.docx_extractor import iter_docx_text
+from tools.json_resume import map_structured_resume, DERIVED_KEYS
+from tools.resume_rules import (
+    extract_contact_info, strip_contact_details, merge_personal_info, segment_sections, fill_date_ranges,
+)
+from config.config import LLM_MAX_CONCURRENCY, RESUME_CHUNKED_EXTRACTION, RESUME_CHUNK_MIN_CHARS
+from services.resume_cache import resume_fingerprint, get_cached_resume, save_cached_resume
+
+logger = logging.getLogger(__name__)
+
+# Targeted schemas for section-chunked extraction of long resumes
+SECTION_SCHEMAS = {
+    "experience": "{ 'experience': [ { 'title': '', 'company': '', 'location': '', 'duration': '', 'responsibilities': [] } ] }",
+    "projects": "{ 'projects': [ { 'title': '', 'duration': '', 'description': [] } ] }",
+    "education": "{ 'education': [ { 'degree': '', 'major': '', 'institution': '', 'year': '', 'cgpa_or_percentage': '' } ] }",
+    "certifications": "{ 'certifications': [ { 'name': '', 'organization': '' } ] }",
+    "publications": "{ 'publications': [ { 'title': '', 'contributions': [] } ] }",
+}
+PROFILE_SCHEMA = (
+    "{ 'personal_info': { 'name': '', 'location': '' }, 'summary': '', "
+    "'skills': { 'languages': [], 'frameworks': [], 'cloud': [], 'tools': [], 'other': [] }, "
+    "'interpersonal_skills': [] }"
+)
+ASSESSMENT_SCHEMA = "{ 'ats_score': 0, 'match_recommendations': [] }"
+ASSESSMENT_NOTE = (
+    "Give an ATS score from 0 to 100 and concrete recommendations to improve the ATS match. "
+    "PLEASE UNDERSTAND RESUME FIRST AND GIVE ATS SCORE AND MATCH RECOMMENDATIONS VERY CAREFULLY.\n"
+)
+RESUME_KEY_ORDER = [
+    "personal_info", "summary", "skills", "experience", "projects", "education",
+    "certifications", "publications", "interpersonal_skills", "ats_score", "match_recommendations",
+]
+# Sections every complete extraction has; a result without them is partial
+REQUIRED_RESUME_KEYS = ("skills", "experience", "education", "ats_score")
+
+
+def log_compaction(stats):
+    """Log how much compact_resume_text shrank the text sent to the LLM."""
+    logger.info(
+        "Resume compacted: ~%d -> ~%d tokens (%d -> %d chars)",
+        stats["tokens_before"], stats["tokens_after"], stats["chars_before"], stats["chars_after"],
+    )
+
+
+def is_complete_resume(result):
+    """True for an extraction result that has every required section and no error (safe to cache)."""
+    return isinstance(result, dict) and "error" not in result and all(key in result for key in REQUIRED_RESUME_KEYS)
+
+
+def sniff_resume_format(data):
+    """
+    Guess a resume's format from its leading bytes.
+
+    Returns:
+        str | None: "pdf", "docx", "json", "txt", or None if unrecognized
+    """
+    head = bytes(data[:8])
+    if head.startswith(b'%PDF-'):
+        return 'pdf'
+    if head.startswith(b'PK\x03\x04'):
+        # DOCX is a zip container; other zips are not resumes we can read
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            return 'docx' if 'word/document.xml' in archive.namelist() else None
+    try:
+        text = bytes(data).decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return None
+    if text.lstrip()[:1] in ('{', '['):
+        try:
+            json.loads(text)
+            return 'json'
+        except json.JSONDecodeError:
+            pass
+    return 'txt'
 
 class ResumeParseInput(BaseModel):
     resume_path: str = Field(description="Path to the resume file")
@@ -24,12 +103,44 @@ class ResumeParseTool(BaseTool):
             return {"error": f"Invalid or missing file: {resume_path}"}
         return self._extract_from_resume(resume_path)
 
-    def _extract_from_resume(self, resume_path: str) -> dict:
+    def _extract_from_resume(self, resume_path: str = None, data=None) -> dict:
+        """
+        Extract structured information from a resume file path or from raw bytes.
+        """
         try:
-            content = self._read_resume_file(resume_path)
-            return self._extract_information(content)
+            digest, content, cached_result = self._load_cached(resume_path, data)
+            if cached_result is not None:
+                return cached_result
+            result = self._extract_information(content)
+            if is_complete_resume(result):
+                save_cached_resume(digest, content, result)
+            return result
         except Exception as e:
             return {"error": str(e)}
+
+    def _extract_from_bytes(self, data) -> dict:
+        """
+        Extract structured information from an in-memory resume (bytes or memoryview),
+        without writing it to disk. The format is sniffed from the content.
+        """
+        return self._extract_from_resume(data=data)
+
+    def _load_cached(self, resume_path=None, data=None):
+        """
+        Return (digest, text, result) for a resume file or in-memory bytes, reusing any
+        cached text/analysis for identical contents. `result` is None when the LLM step
+        still has to run.
+        """
+        if data is None:
+            with open(resume_path, 'rb') as file:
+                data = file.read()
+        digest = resume_fingerprint(data)
+        cached = get_cached_resume(digest)
+        if cached:
+            return digest, cached["text"], cached.get("result")
+        content = self._read_resume_file(resume_path) if resume_path else self._read_resume_bytes(data)
+        save_cached_resume(digest, content)
+        return digest, content, None
     
     def _read_resume_file(self, path):
         ext = path.lower().split('.')[-1]
@@ -44,21 +155,32 @@ class ResumeParseTool(BaseTool):
         else:
             raise ValueError("Unsupported file type")
 
+    def _read_resume_bytes(self, data):
+        """
+        Read resume text from in-memory bytes, picking the parser from magic bytes
+        rather than a file extension.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        fmt = sniff_resume_format(data)
+        if fmt == 'pdf':
+            return extract_pdf_text(data)
+        elif fmt == 'docx':
+            return self._parse_docx(io.BytesIO(data))
+        elif fmt == 'json':
+            return minify_json(json.loads(data))
+        elif fmt == 'txt':
+            return data.decode('utf-8', errors='replace')
+        else:
+            raise ValueError("Unsupported file type")
+
     def _parse_pdf(self, path):
-        import PyPDF2
-        text = ""
-        with open(path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
+        # Pages come back form-feed separated for header/footer stripping; large PDFs are read in parallel
+        return extract_pdf_text(path)
 
     def _parse_docx(self, path):
-        from docx import Document
-        doc = Document(path)
-        return "\n".join([para.text for para in doc.paragraphs])
+        # Streams word/document.xml instead of loading the full python-docx model; includes table text
+        return "\n".join(iter_docx_text(path))
 
     def _parse_txt(self, path):
         with open(path, 'r', encoding='utf-8') as file:
@@ -66,18 +188,35 @@ class ResumeParseTool(BaseTool):
 
     def _parse_json(self, path):
         with open(path, 'r', encoding='utf-8') as file:
-            return json.dumps(json.load(file), indent=2)
+            return minify_json(json.load(file))
 
-    def _extract_information(self, content):
-        from services.llm_service import LLMService
-        prompt = (
+    def _build_extraction_prompt(self, content, contact_info=None):
+        """
+        Build the extraction prompt. When `contact_info` was already extracted by the
+        rule-based pre-extractor, the LLM is only asked for the judgment fields.
+        """
+        content, stats = compact_resume_text(content)
+        log_compaction(stats)
+        if contact_info:
+            prefilled_note = (
+                "Contact details (email, phone, LinkedIn, GitHub) were already extracted; "
+                "do not output them.\n\n"
+            )
+            personal_info_schema = "  'personal_info': { 'name': '', 'location': '' },\n"
+        else:
+            prefilled_note = ""
+            personal_info_schema = (
+                "  'personal_info': { 'name': '', 'email': '', 'phone': '', 'location': '', 'linkedin': '', 'github': '' },\n"
+            )
+        return (
     "Analyze the following resume and extract all relevant information into structured JSON format. "
     "PLEASE UNDERSTAND RESUME FIRST AND GIVE ATS SCORE AND MATCH RECOMMENDATIONS VERY CAREFULLY."
     "Do not hallucinate or fill in missing data. Only extract what is present. "
     "If any field is not found, leave it empty or omit it.\n\n"
+    f"{prefilled_note}"
     "Use this general structure as a guide:\n"
     "{\n"
-    "  'personal_info': { 'name': '', 'email': '', 'phone': '', 'location': '', 'linkedin': '', 'github': '' },\n"
+    f"{personal_info_schema}"
     "  'summary': '',\n"
     "  'skills': { 'languages': [], 'frameworks': [], 'cloud': [], 'tools': [], 'other': [] },\n"
     "  'experience': [ { 'title': '', 'company': '', 'location': '', 'duration': '', 'responsibilities': [] } ],\n"
@@ -93,12 +232,212 @@ class ResumeParseTool(BaseTool):
     f"{content}"
 )
 
-        llm = LLMService()
+    def _parse_llm_json(self, response):
+        """Decode an LLM response as JSON (tolerating fences, prose and truncation), or return None."""
+        try:
+            return extract_json(response)
+        except LLMJSONDecodeError:
+            return None
+
+    def _plan_chunks(self, content):
+        """
+        Split a long resume into per-section extraction prompts.
+
+        Returns:
+            tuple: (contact_info, {chunk_name: prompt}), or (contact_info, None) when the
+            resume is too short or has too few recognizable sections to be worth splitting
+        """
+        contact_info = extract_contact_info(content)
+        content, stats = compact_resume_text(strip_contact_details(content, contact_info))
+        if len(content) < RESUME_CHUNK_MIN_CHARS:
+            return contact_info, None
+        sections = segment_sections(content)
+        targeted = [name for name in sections if name in SECTION_SCHEMAS]
+        if len(targeted) < 2:
+            return contact_info, None
+
+        prompts = {name: self._build_partial_prompt(SECTION_SCHEMAS[name], sections[name]) for name in targeted}
+        # Short leftover sections (header, summary, skills, ...) share one profile prompt
+        profile_text = "\n\n".join(body for name, body in sections.items() if name not in SECTION_SCHEMAS)
+        if profile_text:
+            prompts["profile"] = self._build_partial_prompt(PROFILE_SCHEMA, profile_text)
+        # ATS scoring needs the whole resume, but its output is tiny
+        prompts["assessment"] = self._build_partial_prompt(ASSESSMENT_SCHEMA, content, ASSESSMENT_NOTE)
+        log_compaction(stats)
+        return contact_info, prompts
+
+    def _build_partial_prompt(self, schema, text, note=""):
+        """Prompt for extracting only the fields in `schema` from `text`."""
+        return (
+            "Extract information from the following part of a resume into JSON matching this structure:\n"
+            f"{schema}\n"
+            "Do not hallucinate or fill in missing data. Only extract what is present. "
+            "If any field is not found, leave it empty or omit it.\n"
+            f"{note}"
+            "Output only valid JSON, no markdown or commentary.\n\n"
+            f"{text}"
+        )
+
+    def _assess_structured(self, structured):
+        """
+        Ask the LLM only for the derived fields (ats_score, match_recommendations) of an
+        already-structured resume. Returns {} if the response cannot be parsed.
+        """
+        if all(key in structured for key in DERIVED_KEYS):
+            return {}
+        prompt = self._build_partial_prompt(ASSESSMENT_SCHEMA, minify_json(structured), ASSESSMENT_NOTE)
+        parsed = self._parse_llm_json(get_llm_service().generate_response(prompt))
+        if not isinstance(parsed, dict):
+            return {}
+        return {key: parsed[key] for key in DERIVED_KEYS if key in parsed}
+
+    def _iter_chunk_results(self, prompts):
+        """
+        Run chunk prompts concurrently and yield (chunk_name, parsed_json_or_None) as each completes.
+
+        The requests go through the LLM service's shared concurrency limit, so running
+        several resumes at once (bulk ingestion) does not multiply the in-flight calls.
+        """
+        llm = get_llm_service()
+        with ThreadPoolExecutor(max_workers=max(1, min(LLM_MAX_CONCURRENCY, len(prompts)))) as executor:
+            futures = {executor.submit(llm.generate_response, prompt): name for name, prompt in prompts.items()}
+            for future in as_completed(futures):
+                try:
+                    parsed = self._parse_llm_json(future.result())
+                except Exception as e:
+                    print(f"Error extracting resume section '{futures[future]}':", e)
+                    parsed = None
+                yield futures[future], parsed if isinstance(parsed, dict) else None
+
+    def _extract_information_chunked(self, content):
+        """
+        Extract a long resume section by section, in parallel, and merge the partial
+        results into the usual resume JSON shape.
+
+        Returns None when the resume is not worth splitting, so callers can fall back
+        to single-prompt extraction.
+        """
+        contact_info, prompts = self._plan_chunks(content)
+        if not prompts:
+            return None
+        merged = {}
+        for name, partial in self._iter_chunk_results(prompts):
+            if partial is None:
+                if name != "assessment":
+                    return {"error": f"Invalid JSON from LLM for resume section '{name}'"}
+                continue
+            merged.update(partial)
+        result = {key: merged[key] for key in RESUME_KEY_ORDER if key in merged}
+        result.update({key: value for key, value in merged.items() if key not in result})
+        return fill_date_ranges(merge_personal_info(result, contact_info), content)
+
+    def _extract_information(self, content):
+        # Structured uploads (JSON Resume / our own export) are mapped directly
+        structured = map_structured_resume(content)
+        if structured is not None:
+            structured.update(self._assess_structured(structured))
+            return structured
+
+        if RESUME_CHUNKED_EXTRACTION:
+            result = self._extract_information_chunked(content)
+            if result is not None:
+                return result
+
+        # Deterministic fields come from regexes; the LLM only fills in the rest
+        contact_info = extract_contact_info(content)
+        prompt = self._build_extraction_prompt(strip_contact_details(content, contact_info), contact_info)
+
+        llm = get_llm_service()
         response = llm.generate_response(prompt)
 
-        try:
-            cleaned = re.sub(r"^```(?:json)?\s*|\s*```$", "", response.strip(), flags=re.DOTALL)
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
+        parsed = self._parse_llm_json(response)
+        if parsed is None:
             return {"error": "Invalid JSON from LLM", "raw_response": response}
+        # Dates printed next to each role/degree are taken verbatim from the text
+        return fill_date_ranges(merge_personal_info(parsed, contact_info), content)
+
+    def _stream_from_resume(self, resume_path=None, data=None):
+        """
+        Stream the structured resume one top-level section at a time.
+
+        Args:
+            resume_path (str, optional): Path to the resume file
+            data (bytes, optional): In-memory resume contents, used instead of a path
+
+        Yields:
+            tuple: (section_name, value) as soon as each section is complete
+        """
+        try:
+            digest, content, cached_result = self._load_cached(resume_path, data)
+        except Exception as e:
+            yield "error", str(e)
+            return
+        if cached_result is not None:
+            yield from cached_result.items()
+            return
+
+        result = {}
+        for key, value in self._stream_information(content):
+            result[key] = value
+            yield key, value
+        if is_complete_resume(result):
+            save_cached_resume(digest, content, result)
+
+    def _stream_information(self, content):
+        """
+        Like _extract_information, but yields (section_name, value) pairs while the LLM is still generating.
+        """
+        structured = map_structured_resume(content)
+        if structured is not None:
+            yield from structured.items()
+            yield from self._assess_structured(structured).items()
+            return
+
+        if RESUME_CHUNKED_EXTRACTION:
+            contact_info, prompts = self._plan_chunks(content)
+            if prompts:
+                yield from self._stream_chunked(contact_info, prompts, content)
+                return
+
+        contact_info = extract_contact_info(content)
+        prompt = self._build_extraction_prompt(strip_contact_details(content, contact_info), contact_info)
+        if contact_info:
+            # Show contact details immediately; re-emitted once the LLM adds name/location
+            yield "personal_info", dict(contact_info)
+
+        llm = get_llm_service()
+        assembler = IncrementalJSONAssembler()
+        emitted = set()
+        for chunk in llm.stream_response(prompt):
+            for key, value in assembler.feed(chunk):
+                if key == "personal_info":
+                    value = merge_personal_info({key: value}, contact_info)[key]
+                value = fill_date_ranges({key: value}, content)[key]
+                emitted.add(key)
+                yield key, value
+
+        if not assembler.done or not all(key in emitted for key in REQUIRED_RESUME_KEYS):
+            try:
+                # The object never closed cleanly or is missing sections (e.g. single-quoted
+                # output); parse the whole text.
+                result = merge_personal_info(assembler.finish(REQUIRED_RESUME_KEYS), contact_info)
+                result = fill_date_ranges(result, content)
+                for key, value in result.items():
+                    if key not in emitted:
+                        yield key, value
+            except ValueError:
+                yield "error", "Invalid JSON from LLM"
+                yield "raw_response", assembler.buffer
 
+    def _stream_chunked(self, contact_info, prompts, content):
+        """Yield (section_name, value) pairs as each parallel section extraction finishes."""
+        if contact_info:
+            yield "personal_info", dict(contact_info)
+        for name, partial in self._iter_chunk_results(prompts):
+            if partial is None:
+                if name != "assessment":
+                    yield "error", f"Invalid JSON from LLM for resume section '{name}'"
+                continue
+            if "personal_info" in partial:
+                partial = merge_personal_info(partial, contact_info)
+            yield from fill_date_ranges(partial, content).items()
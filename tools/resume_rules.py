@@ -0,0 +1,239 @@
+# tools/resume_rules.py
+import re
+
+# Deterministic resume fields extracted locally, so the LLM only handles what needs judgment.
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+PHONE_RE = re.compile(r"(?<![\w/])\+?\(?\d[\d\s().-]{7,18}\d(?![\w/])")
+LINKEDIN_RE = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+/?", re.IGNORECASE)
+GITHUB_RE = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9-]+(?:/[A-Za-z0-9_.-]+)*/?", re.IGNORECASE)
+
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+    r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+_DATE = rf"(?:{_MONTH}\.?,?\s+(?:19|20)\d{{2}}|\d{{1,2}}/(?:19|20)\d{{2}}|(?:19|20)\d{{2}})"
+DATE_RANGE_RE = re.compile(
+    rf"\b{_DATE}\s*(?:-|–|—|to)\s*(?:{_DATE}|present|current|now|till date|ongoing)\b",
+    re.IGNORECASE,
+)
+
+# Canonical section -> heading variants (compared lower-cased, without trailing colon)
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "about me", "objective", "career objective"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "internships", "internship experience"],
+    "education": ["education", "academic background", "academics", "education and training"],
+    "skills": ["skills", "technical skills", "key skills", "core competencies", "technologies",
+               "tech stack", "skills and tools"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses"],
+    "publications": ["publications", "research", "papers", "research publications"],
+    "interpersonal_skills": ["interpersonal skills", "soft skills"],
+    "achievements": ["achievements", "awards", "honors", "honours", "awards and achievements"],
+}
+_HEADING_LOOKUP = {variant: section for section, variants in SECTION_HEADINGS.items() for variant in variants}
+_HEADING_CLEAN_RE = re.compile(r"[\s:•\-–—|]+$|^[\s•\-–—|]+")
+
+# Section -> (date range field of each item, item fields that name it in the resume text).
+# Education is left out: its "year" is a single year, not a range.
+DATE_FIELDS = {
+    "experience": ("duration", ("company", "title")),
+    "projects": ("duration", ("title",)),
+}
+
+
+def _first(pattern, text):
+    match = pattern.search(text)
+    return match.group(0).rstrip("/") if match else ""
+
+
+def find_phone(text):
+    """Return the first phone-like number with 10-15 digits (so dates and ranges are ignored)."""
+    for match in PHONE_RE.finditer(text):
+        candidate = match.group(0).strip()
+        if 10 <= sum(ch.isdigit() for ch in candidate) <= 15 and not DATE_RANGE_RE.search(candidate):
+            return candidate
+    return ""
+
+
+def extract_contact_info(text):
+    """
+    Extract email, phone, LinkedIn and GitHub from resume text.
+
+    Returns:
+        dict: Only the fields that were found
+    """
+    github = _first(GITHUB_RE, text)
+    if github:
+        # Keep the profile URL, not a repository path
+        github = re.sub(r"(github\.com/[A-Za-z0-9-]+).*", r"\1", github, flags=re.IGNORECASE)
+    fields = {
+        "email": _first(EMAIL_RE, text),
+        "phone": find_phone(text),
+        "linkedin": _first(LINKEDIN_RE, text),
+        "github": github,
+    }
+    return {key: value for key, value in fields.items() if value}
+
+
+def _heading_for(line):
+    cleaned = _HEADING_CLEAN_RE.sub("", line).lower()
+    cleaned = re.sub(r"\s+", " ", cleaned).replace("&", "and")
+    if len(cleaned) > 40:
+        return None
+    return _HEADING_LOOKUP.get(cleaned)
+
+
+def segment_sections(text):
+    """
+    Split resume text into sections by recognizing common headings.
+
+    Text before the first recognized heading is returned under "header".
+    Repeated headings for the same section are concatenated.
+
+    Returns:
+        dict: canonical section name -> section text, in document order
+    """
+    sections = {}
+    current = "header"
+    lines = []
+    for line in text.split("\n"):
+        section = _heading_for(line) if line.strip() else None
+        if section:
+            if lines:
+                sections[current] = (sections.get(current, "") + "\n" + "\n".join(lines)).strip()
+            current, lines = section, []
+        else:
+            lines.append(line)
+    if lines:
+        sections[current] = (sections.get(current, "") + "\n" + "\n".join(lines)).strip()
+    return {name: body for name, body in sections.items() if body}
+
+
+def strip_contact_details(text, contact_info):
+    """
+    Remove the first occurrence of each already-extracted contact detail from `text`
+    so it is not re-sent to the LLM. Later matches (e.g. project repository links) are kept.
+    """
+    patterns = {"email": EMAIL_RE, "linkedin": LINKEDIN_RE, "github": GITHUB_RE}
+    for field, pattern in patterns.items():
+        if field in contact_info:
+            text = pattern.sub("", text, count=1)
+    if "phone" in contact_info:
+        text = text.replace(contact_info["phone"], "", 1)
+    # Tidy separators left behind, e.g. "Bengaluru |  |  | " -> "Bengaluru"
+    text = re.sub(r"(?:[ \t]*[|•·][ \t]*){2,}", " | ", text)
+    return re.sub(r"[ \t]*[|•·][ \t]*$", "", text, flags=re.MULTILINE)
+
+
+def merge_personal_info(llm_result, contact_info):
+    """
+    Merge rule-extracted contact fields into the LLM's personal_info.
+
+    Deterministic values win over the LLM's when both are present.
+    """
+    if not isinstance(llm_result, dict) or not contact_info:
+        return llm_result
+    personal_info = llm_result.get("personal_info")
+    if not isinstance(personal_info, dict):
+        personal_info = {}
+    merged = dict(personal_info)
+    merged.update(contact_info)
+    llm_result["personal_info"] = merged
+    return llm_result
+
+
+def _collapse(text):
+    return re.sub(r"\s+", " ", str(text or "")).strip().lower()
+
+
+def _normalize_range(value):
+    """Comparable form of a date range: "Jan 2020 – Present" -> "jan2020-present"."""
+    return re.sub(r"\s+", "", re.sub(r"[–—]|\bto\b", "-", str(value or "").lower()))
+
+
+def _anchor_lines(lines, names):
+    """Lines mentioning any of `names`, those naming more of them (then shorter ones) first."""
+    found = [i for i, line in enumerate(lines) if any(name in line for name in names)]
+    return sorted(found, key=lambda i: (-sum(name in lines[i] for name in names), len(lines[i])))
+
+
+def _claim(ranges, line_indexes, used):
+    for j in line_indexes:
+        for spot, found in ranges.get(j, ()):
+            if spot not in used:
+                used.add(spot)
+                return found
+    return None
+
+
+def fill_date_ranges(llm_result, text, window=2):
+    """
+    Set the duration of experience and project items to the date range printed next to
+    them in the resume. Each range is used once, so two roles at one company get their own
+    dates. In order of preference an item gets:
+
+    1. the range on a line naming all of its title/company (the shortest such line, so
+       "Engineer" does not take the "Senior Engineer" line),
+    2. the LLM's own value, when it matches a range printed in the text,
+    3. a range on, or within `window` lines of, any line naming its title or company.
+
+    Items with none of these keep the LLM's value.
+    """
+    if not isinstance(llm_result, dict) or not text:
+        return llm_result
+    lines = [_collapse(line) for line in text.split("\n")]
+    ranges = {}
+    printed = {}
+    for j, line in enumerate(lines):
+        for match in DATE_RANGE_RE.finditer(line):
+            spot = (j, match.start())
+            ranges.setdefault(j, []).append((spot, match.group(0)))
+            printed.setdefault(_normalize_range(match.group(0)), []).append(spot)
+
+    used = set()
+    for section, (field, anchors) in DATE_FIELDS.items():
+        items = llm_result.get(section)
+        if not isinstance(items, list):
+            continue
+        named = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            names = [name for name in (_collapse(item.get(anchor)) for anchor in anchors) if len(name) >= 3]
+            if names:
+                named.append((item, names))
+
+        pending = []
+        for item, names in named:
+            full = [i for i in _anchor_lines(lines, names) if all(name in lines[i] for name in names)]
+            found = _claim(ranges, full, used)
+            if found:
+                item[field] = _original_case(text, found)
+            else:
+                pending.append((item, names))
+
+        unresolved = []
+        for item, names in pending:
+            spots = [spot for spot in printed.get(_normalize_range(item.get(field)), []) if spot not in used]
+            if spots:
+                used.add(spots[0])
+            else:
+                unresolved.append((item, names))
+
+        for item, names in unresolved:
+            anchor_lines = _anchor_lines(lines, names)
+            nearby = [
+                j for i in anchor_lines
+                for j in [*range(i + 1, min(len(lines), i + window + 1)), *range(i - 1, max(-1, i - window - 1), -1)]
+            ]
+            found = _claim(ranges, anchor_lines + nearby, used)
+            if found:
+                item[field] = _original_case(text, found)
+    return llm_result
+
+
+def _original_case(text, found):
+    match = re.search(r"\s+".join(re.escape(part) for part in found.split(" ")), text, re.IGNORECASE)
+    return match.group(0) if match else found
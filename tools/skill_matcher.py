@@ -0,0 +1,356 @@
+# tools/skill_matcher.py
+import re
+import json
+import bisect
+from collections import deque
+
+# Canonical skill -> synonyms (matched case-insensitively on word boundaries).
+# Forms that are also ordinary English words ("go", "excel", "swift", "node", "agile") live in
+# CASE_SENSITIVE_SKILLS instead and only match in a skills-list or tech context: in any casing
+# as a stand-alone list item ("python, excel, sql"), or with their exact casing next to another
+# skill or a tech word ("Node and Express", "Swift developer"). Free prose ("Excel at
+# communication", "Intern - Spring 2025", "R&D") does not match.
+SKILL_TAXONOMY = {
+    # Languages
+    "Python": ["python", "python3", "py3"],
+    "Java": ["java", "java 8", "java 11", "java 17"],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6"],
+    "TypeScript": ["typescript"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp", "c sharp"],
+    "Go": ["golang", "go lang"],
+    "Rust": ["rustlang"],
+    "Kotlin": ["kotlin"],
+    "Swift": [],
+    "Ruby": ["ruby on rails"],
+    "PHP": ["php"],
+    "Scala": ["scala"],
+    "R": [],
+    "SQL": ["sql", "t-sql", "pl/sql", "plsql"],
+    "Bash": ["bash", "shell scripting", "shell script"],
+    # Web
+    "React": ["react.js", "reactjs", "react native"],
+    "Angular": ["angular", "angularjs", "angular.js"],
+    "Vue": ["vue", "vue.js", "vuejs"],
+    "Next.js": ["next.js", "nextjs"],
+    "Node.js": ["node.js", "nodejs"],
+    "Express": ["express.js", "expressjs"],
+    "Django": ["django"],
+    "Flask": [],
+    "FastAPI": ["fastapi", "fast api"],
+    "Spring": ["spring boot", "springboot", "spring framework"],
+    ".NET": [".net", "dotnet", "asp.net", ".net core"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3", "tailwind", "tailwindcss", "scss"],
+    "GraphQL": ["graphql"],
+    "REST APIs": ["rest api", "rest apis", "restful", "restful api", "restful apis"],
+    # Data / ML
+    "Machine Learning": ["machine learning"],
+    "Deep Learning": ["deep learning", "neural networks", "neural network"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision", "opencv"],
+    "LLMs": ["llm", "llms", "large language models", "large language model", "generative ai", "genai"],
+    "TensorFlow": ["tensorflow", "tf2", "keras"],
+    "PyTorch": ["pytorch"],
+    "scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "Spark": ["pyspark", "apache spark", "spark sql"],
+    "Hadoop": ["hadoop", "hdfs"],
+    "Kafka": ["kafka", "apache kafka"],
+    "Airflow": ["airflow", "apache airflow"],
+    "Data Analysis": ["data analysis", "data analytics"],
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+    "Excel": ["ms excel", "microsoft excel", "ms-excel"],
+    "Statistics": ["statistics", "statistical analysis"],
+    # Databases
+    "PostgreSQL": ["postgresql", "postgres", "psql"],
+    "MySQL": ["mysql"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elasticsearch", "elastic search", "opensearch"],
+    "Snowflake": [],
+    "BigQuery": ["bigquery", "big query"],
+    "DynamoDB": ["dynamodb"],
+    # Cloud / DevOps
+    "AWS": ["aws", "amazon web services", "ec2", "s3", "aws lambda"],
+    "Azure": ["azure", "microsoft azure"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Docker": ["docker", "containerization", "dockerfile"],
+    "Kubernetes": ["kubernetes", "k8s", "eks", "gke", "aks"],
+    "Terraform": ["terraform"],
+    "Ansible": ["ansible"],
+    "CI/CD": ["ci/cd", "cicd", "continuous integration", "continuous delivery", "continuous deployment",
+              "jenkins", "github actions", "gitlab ci"],
+    "Linux": ["linux", "unix"],
+    "Git": ["github", "gitlab", "bitbucket"],
+    "Microservices": ["microservices", "microservice", "micro-services"],
+    # Practices / other
+    "Agile": ["scrum", "kanban", "agile methodology", "agile methodologies"],
+    "System Design": ["system design", "distributed systems"],
+    "Unit Testing": ["unit testing", "unit tests", "pytest", "junit", "tdd"],
+    "Data Structures & Algorithms": ["data structures", "algorithms", "dsa"],
+    "Figma": ["figma"],
+    "Jira": ["jira"],
+}
+CASE_SENSITIVE_SKILLS = {
+    "Go": ["Go"],
+    "R": ["R"],
+    "Swift": ["Swift"],
+    "Rust": ["Rust"],
+    "Ruby": ["Ruby"],
+    "TypeScript": ["TS"],
+    "React": ["React", "REACT"],
+    "Node.js": ["Node", "NodeJS"],
+    "Express": ["Express"],
+    "Flask": ["Flask"],
+    "Spring": ["Spring"],
+    "CSS": ["Sass", "SASS"],
+    "Machine Learning": ["ML"],
+    "Deep Learning": ["DL"],
+    "PyTorch": ["Torch"],
+    "Spark": ["Spark"],
+    "Excel": ["Excel", "EXCEL"],
+    "Snowflake": ["Snowflake"],
+    "Git": ["Git", "GIT"],
+    "Agile": ["Agile"],
+    "Unit Testing": ["Jest"],
+}
+# Characters that may sit before / after a stand-alone list item ("python, excel | sql");
+# "-" and "*" only count as bullets at the start of a line ("- git")
+_ITEM_BEFORE = "\n,;|/•·:("
+_ITEM_AFTER = "\n,;|/•·:)"
+_BULLETS = "-*"
+# Words next to an ambiguous form that mark it as a technology ("React developer", "Excel macros")
+TECH_CUE_WORDS = {
+    "developer", "developers", "development", "engineer", "engineers", "programming", "programmer",
+    "programmers", "framework", "frameworks", "library", "libraries", "language", "languages", "api",
+    "apis", "sdk", "stack", "backend", "frontend", "code", "codebase", "spreadsheets", "macros",
+    "vba", "streaming", "cluster", "clusters", "scripts", "scripting", "repository", "repositories",
+}
+# Words skipped when looking for the neighbour of an ambiguous form ("Node and Express")
+_CONNECTORS = {"and", "or", "with", "in", "using", "&", "+"}
+_SENTENCE_BREAKS = ".!?;\n"
+_WORD_RE = re.compile(r"[a-z0-9+#&]+(?:\.[a-z0-9]+)*")
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch in "+#_"
+
+
+def _is_list_item(text, start, end):
+    """True when text[start:end] is a whole list item: only separators or line breaks around it."""
+    before = start - 1
+    while before >= 0 and text[before] in " \t":
+        before -= 1
+    after = end
+    while after < len(text) and text[after] in " \t":
+        after += 1
+    if before >= 0 and text[before] in _BULLETS:
+        bullet = before - 1
+        while bullet >= 0 and text[bullet] in " \t":
+            bullet -= 1
+        if bullet < 0 or text[bullet] == "\n":
+            before = bullet
+    return (before < 0 or text[before] in _ITEM_BEFORE) and (after >= len(text) or text[after] in _ITEM_AFTER)
+
+
+def _neighbours(text, words, starts, start, end):
+    """
+    Indexes of the nearest words before and after text[start:end], skipping connectors
+    and never reaching past a sentence break.
+    """
+    before = bisect.bisect_right(starts, start) - 1
+    while before >= 0 and (words[before][1] > start or words[before][2] in _CONNECTORS):
+        before -= 1
+    after = bisect.bisect_left(starts, end)
+    while after < len(words) and words[after][2] in _CONNECTORS:
+        after += 1
+    result = []
+    if before >= 0 and not any(ch in _SENTENCE_BREAKS for ch in text[words[before][1]:start]):
+        result.append(before)
+    if after < len(words) and not any(ch in _SENTENCE_BREAKS for ch in text[end:words[after][0]]):
+        result.append(after)
+    return result
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every skill name and synonym, so all skills in a text
+    are found in one pass regardless of taxonomy size. Matches must start and end on
+    word boundaries ("java" does not match inside "javascript").
+    """
+
+    def __init__(self, taxonomy=None, case_sensitive=None):
+        """
+        Args:
+            taxonomy (dict, optional): canonical skill -> synonyms; defaults to SKILL_TAXONOMY
+            case_sensitive (dict, optional): canonical skill -> exact-case patterns, matched
+                only in a list or tech context; defaults to CASE_SENSITIVE_SKILLS
+        """
+        taxonomy = SKILL_TAXONOMY if taxonomy is None else taxonomy
+        case_sensitive = CASE_SENSITIVE_SKILLS if case_sensitive is None else case_sensitive
+        self.skills = sorted(set(taxonomy) | set(case_sensitive))
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]   # state -> [(pattern length, canonical skill, exact-case pattern or None)]
+        for skill, synonyms in taxonomy.items():
+            patterns = {s.lower() for s in synonyms}
+            # A name that is an ordinary word (e.g. "Go") is only matched via its exact-case pattern
+            if skill.lower() not in {p.lower() for p in case_sensitive.get(skill, ())}:
+                patterns.add(skill.lower())
+            for pattern in patterns:
+                self._insert(pattern, (len(pattern), skill, None))
+        for skill, patterns in case_sensitive.items():
+            for pattern in patterns:
+                self._insert(pattern.lower(), (len(pattern), skill, pattern))
+        self._build_failure_links()
+
+    def _insert(self, pattern, output):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(output)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_skills(self, text):
+        """
+        Return the canonical skills mentioned in `text`.
+
+        Returns:
+            set: Canonical skill names
+        """
+        if not text:
+            return set()
+        text = str(text)
+        lowered = text.lower()
+        if len(lowered) != len(text):  # lower() changed the length (rare); exact-case checks use lowered text
+            text = lowered
+        found = set()
+        ambiguous = []   # (start, end, skill, exact-case pattern) awaiting a context check
+        spans = []       # every word-bounded match, for the neighbour check
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, skill, exact in self._out[state]:
+                start = i - length + 1
+                if start > 0 and _is_word_char(lowered[start - 1]) and _is_word_char(lowered[start]):
+                    continue
+                if i + 1 < len(lowered) and _is_word_char(lowered[i + 1]) and _is_word_char(lowered[i]):
+                    continue
+                spans.append((start, i + 1))
+                if exact is None:
+                    found.add(skill)
+                elif skill not in found:
+                    ambiguous.append((start, i + 1, skill, exact))
+
+        if ambiguous:
+            words = [(m.start(), m.end(), m.group(0)) for m in _WORD_RE.finditer(lowered)]
+            starts = [word[0] for word in words]
+            covered = set()  # indexes of words inside some match
+            for span_start, span_end in spans:
+                index = max(0, bisect.bisect_right(starts, span_start) - 1)
+                while index < len(words) and words[index][0] < span_end:
+                    if words[index][1] > span_start:
+                        covered.add(index)
+                    index += 1
+            for start, end, skill, exact in ambiguous:
+                if skill in found:
+                    continue
+                if _is_list_item(lowered, start, end):
+                    found.add(skill)
+                    continue
+                if text[start:end] != exact:
+                    continue
+                # Neighbours lie outside the match, so a covered neighbour is another skill
+                if any(index in covered or words[index][2] in TECH_CUE_WORDS
+                       for index in _neighbours(lowered, words, starts, start, end)):
+                    found.add(skill)
+        return found
+
+
+_default_matcher = None
+
+
+def get_skill_matcher():
+    """Return a shared SkillMatcher over SKILL_TAXONOMY, built on first use."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher()
+    return _default_matcher
+
+
+def _flatten(value):
+    if isinstance(value, dict):
+        return " \n ".join(_flatten(v) for v in value.values())
+    if isinstance(value, list):
+        return " \n ".join(_flatten(v) for v in value)
+    return str(value) if value is not None else ""
+
+
+def resume_skills(resume, matcher=None):
+    """
+    Canonical skills in a resume: parsed resume dict (all fields are scanned), its JSON
+    string, or plain resume text.
+    """
+    matcher = matcher or get_skill_matcher()
+    if isinstance(resume, str):
+        try:
+            resume = json.loads(resume)
+        except ValueError:
+            return matcher.find_skills(resume)
+    return matcher.find_skills(_flatten(resume))
+
+
+def job_skills(job, matcher=None):
+    """Canonical skills in a job's title and snippet/description."""
+    matcher = matcher or get_skill_matcher()
+    return matcher.find_skills(" \n ".join(
+        str(job.get(field) or "") for field in ("title", "snippet", "description", "requirements")
+    ))
+
+
+def skill_gap(candidate_skills, job, matcher=None):
+    """
+    Compare a candidate's skills with one job.
+
+    Returns:
+        dict: {"matched_skills": [...], "missing_skills": [...], "skill_overlap": 0-1 share
+        of the job's skills the candidate has (None when the job names no known skills)}
+    """
+    required = job_skills(job, matcher)
+    matched = required & set(candidate_skills)
+    return {
+        "matched_skills": sorted(matched),
+        "missing_skills": sorted(required - matched),
+        "skill_overlap": round(len(matched) / len(required), 3) if required else None,
+    }
+
+
+def annotate_jobs(resume, jobs, matcher=None):
+    """Add matched_skills, missing_skills and skill_overlap to each job dict (copies)."""
+    matcher = matcher or get_skill_matcher()
+    candidate = resume_skills(resume, matcher)
+    return [dict(job, **skill_gap(candidate, job, matcher)) for job in jobs if isinstance(job, dict)]
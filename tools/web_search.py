@@ -1,9 +1,12 @@
 # tools/web_search.py
 from pydantic import PrivateAttr
 from crewai.tools import BaseTool
+from crewai_tools import SerperDevTool
 from langchain_community.tools import DuckDuckGoSearchRun
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
+from services.replay import replayable
+from services.search_cache import cached_search
 
 class DuckDuckGoSearchTool(BaseTool):
     name: str = "duckduckgo_search_tool"
@@ -17,6 +20,8 @@ class DuckDuckGoSearchTool(BaseTool):
         # Initialize the search tool using DuckDuckGoSearchRun
         self._search_instance = DuckDuckGoSearchRun(**kwargs)
 
+    @replayable("duckduckgo")
+    @cached_search("duckduckgo")
     def _run(self, query: str) -> dict:
         """Run the search query and return the result as a dictionary."""
         # Call the underlying search tool's run method.
@@ -45,8 +50,23 @@ class TavilySearchTool(BaseTool):
         api_wrapper = TavilySearchAPIWrapper(tavily_api_key=tavily_api_key)
         self._search_instance = TavilySearchResults(api_wrapper=api_wrapper, description=self.description)
 
+    @replayable("tavily")
+    @cached_search("tavily")
     def _run(self, query: str) -> dict:
         """
         Run the search query through Tavily and return the results as a dictionary.
         """
         return self._search_instance.run(query)
+
+
+class SerperSearchTool(SerperDevTool):
+    """
+    SerperDevTool whose calls go through the search result cache (services/search_cache.py)
+    and the record/replay provider layer, so runs can be captured once and served offline
+    (see services/replay.py).
+    """
+
+    @replayable("serper")
+    @cached_search("serper")
+    def _run(self, **kwargs):
+        return super()._run(**kwargs)
@@ -1,7 +1,7 @@
 import os
 import tempfile
 import streamlit as st
-import uuid
+from services.resume_cache import resume_fingerprint
 
 def save_uploaded_file(uploaded_file):
     """
@@ -17,14 +17,15 @@ def save_uploaded_file(uploaded_file):
     temp_dir = os.path.join(tempfile.gettempdir(), "resume_uploads")
     os.makedirs(temp_dir, exist_ok=True)
     
-    # Generate a unique filename
+    # Name the file after its content hash so re-uploads of the same resume reuse one file
+    content = uploaded_file.getbuffer()
     file_extension = os.path.splitext(uploaded_file.name)[1]
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    file_path = os.path.join(temp_dir, unique_filename)
+    file_path = os.path.join(temp_dir, f"{resume_fingerprint(content)}{file_extension}")
     
     # Save the file
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    if not os.path.exists(file_path):
+        with open(file_path, "wb") as f:
+            f.write(content)
     
     return file_path
 
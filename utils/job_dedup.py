@@ -0,0 +1,195 @@
+# utils/job_dedup.py
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import numpy as np
+
+# Query parameters that only track the click, never identify the posting
+TRACKING_PARAMS = {
+    "gclid", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid", "_hsenc", "_hsmi",
+    "ref", "ref_src", "refid", "referrer", "trk", "trkinfo", "trackingid", "src", "source", "from",
+    "spm", "lipi", "campaignid", "originalsubdomain", "si", "feature", "share", "shared_from",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "hsa_")
+_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+# Hosts whose country subdomains serve the same postings (in.linkedin.com, uk.indeed.com, ...)
+_REGIONAL_HOSTS = ("linkedin.com", "indeed.com", "glassdoor.com")
+
+# MinHash/LSH: NUM_PERM = BANDS * ROWS; pairs above ~(1/BANDS)**(1/ROWS) Jaccard become candidates
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+_rng = np.random.default_rng(20240601)
+_PERM_A = _rng.integers(1, 4294967291, MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 4294967291, MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64)
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = {"a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "with", "is", "are", "we", "you"}
+
+
+def canonical_url(url):
+    """
+    Canonicalize a job URL so tracking variants of the same posting compare equal.
+
+    Forces https, lower-cases the host and strips www./m. and regional subdomains of the
+    big job boards, drops tracking parameters and fragments, sorts the remaining query
+    parameters and removes trailing slashes.
+    """
+    if not url or not isinstance(url, str):
+        return ""
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+    host = parts.hostname or ""
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    for board in _REGIONAL_HOSTS:
+        if host.endswith("." + board):
+            host = board
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=False)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(("https", host, parts.path.rstrip("/") or "", urlencode(query), ""))
+
+
+def _words(text):
+    return [word for word in _WORD_RE.findall(str(text).lower()) if word not in _STOPWORDS]
+
+
+def shingles(text):
+    """Word unigrams plus bigrams of `text` (stopwords dropped), as a set."""
+    words = _words(text)
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def minhash(features):
+    """
+    Return the MinHash signature (MINHASH_BANDS * MINHASH_ROWS uint64 values) of a feature set.
+
+    Features are hashed with Python's built-in (per-process salted) string hash, so
+    signatures are only comparable within one process; they are never persisted.
+    """
+    if not features:
+        return np.full(MINHASH_BANDS * MINHASH_ROWS, _PRIME, dtype=np.uint64)
+    hashes = np.array([hash(feature) & 0xFFFFFFFF for feature in features], dtype=np.uint64)
+    # (a * h + b) mod p for every permutation at once; a, b, h < 2**32 so nothing overflows
+    return ((hashes[:, None] * _PERM_A + _PERM_B) % _PRIME).min(axis=0)
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def _job_text(job):
+    return " ".join(str(job.get(field) or "") for field in ("title", "company", "snippet"))
+
+
+def _company(job):
+    return " ".join(_WORD_RE.findall(str(job.get("company") or "").lower()))
+
+
+def _merge_into(kept, duplicate):
+    """Fill gaps in the kept posting from its duplicate and carry over sources/score."""
+    for key, value in duplicate.items():
+        if value not in (None, "", []) and kept.get(key) in (None, "", []):
+            kept[key] = value
+    sources = list(kept.get("sources") or ([kept["source"]] if kept.get("source") else []))
+    for source in duplicate.get("sources") or ([duplicate["source"]] if duplicate.get("source") else []):
+        if source not in sources:
+            sources.append(source)
+    if sources:
+        kept["sources"] = sources
+    scores = [s for s in (kept.get("match_score"), duplicate.get("match_score")) if isinstance(s, (int, float))]
+    if scores:
+        kept["match_score"] = max(scores)
+    kept["duplicates"] = kept.get("duplicates", 0) + 1 + duplicate.get("duplicates", 0)
+
+
+def find_duplicate_groups(jobs, threshold=0.6, title_threshold=0.6):
+    """
+    Group postings that share a canonical URL, or whose title+company+snippet shingle sets
+    have an estimated Jaccard similarity of at least `threshold`.
+
+    Candidate pairs come from MinHash LSH banding, so the work is near-linear in len(jobs)
+    rather than quadratic. Candidates must also agree on company (when both name one) and
+    have titles at least `title_threshold` similar, so templated postings for different
+    roles at one employer stay separate.
+
+    Returns:
+        list: Groups of indexes into `jobs`, each in input order, groups ordered by first index
+    """
+    parent = list(range(len(jobs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    by_url = {}
+    buckets = {}
+    signatures = []
+    for i, job in enumerate(jobs):
+        url = canonical_url(job.get("url"))
+        if url:
+            if url in by_url:
+                union(by_url[url], i)
+            else:
+                by_url[url] = i
+        signature = minhash(shingles(_job_text(job)))
+        signatures.append(signature)
+        for band in range(MINHASH_BANDS):
+            rows = signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+            buckets.setdefault((band, rows.tobytes()), []).append(i)
+
+    companies = [_company(job) for job in jobs]
+    titles = [set(_words(job.get("title") or "")) for job in jobs]
+    for members in buckets.values():
+        for a_pos, a in enumerate(members):
+            for b in members[a_pos + 1:]:
+                if find(a) == find(b):
+                    continue
+                if companies[a] and companies[b] and companies[a] != companies[b]:
+                    continue
+                if jaccard(titles[a], titles[b]) < title_threshold:
+                    continue
+                if np.mean(signatures[a] == signatures[b]) >= threshold:
+                    union(a, b)
+
+    groups = {}
+    for i in range(len(jobs)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values(), key=lambda group: group[0])
+
+
+def dedupe_jobs(jobs, threshold=0.6):
+    """
+    Collapse duplicate job postings, keeping the first copy of each.
+
+    The kept posting gets its URL canonicalized, missing fields filled from its duplicates,
+    the union of their "sources", the best "match_score" and a "duplicates" count.
+
+    Args:
+        jobs (list): Job dicts with title/company/snippet/url keys
+        threshold (float): Minimum estimated Jaccard similarity for near-duplicates
+
+    Returns:
+        list: De-duplicated jobs, in original order
+    """
+    jobs = [job for job in jobs if isinstance(job, dict)]
+    unique = []
+    for group in find_duplicate_groups(jobs, threshold=threshold):
+        kept = dict(jobs[group[0]])
+        if kept.get("url"):
+            kept["url"] = canonical_url(kept["url"])
+        for i in group[1:]:
+            _merge_into(kept, jobs[i])
+        unique.append(kept)
+    return unique
@@ -0,0 +1,246 @@
+# utils/json_decoder.py
+import re
+import ast
+import json
+
+# Tolerant decoding of JSON produced by LLMs: code fences, prose around the payload,
+# single quotes, Python literals, trailing commas and truncated output.
+
+_FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+# Per-task output schemas. "type" is the expected top-level type; for lists, items missing
+# a "required" key are dropped; for dicts, at least one "any_of" key must be present.
+TASK_SCHEMAS = {
+    "analyze_resume": {
+        "type": dict,
+        "any_of": ["personal_info", "summary", "skills", "experience", "education", "projects"],
+    },
+    "search_jobs": {
+        "type": list,
+        "required": ["title", "url"],
+    },
+    "improve_resume": {
+        "type": dict,
+        "any_of": ["summary", "improvement_areas", "skills_suggestions", "experience_suggestions",
+                   "keyword_suggestions", "improved_summary"],
+    },
+}
+
+
+class LLMJSONDecodeError(ValueError):
+    """Raised when no usable JSON could be salvaged from an LLM response."""
+
+
+def _scan(text):
+    """
+    Single pass over `text` locating top-level JSON objects/arrays.
+
+    Returns:
+        tuple: (start, end, stack, in_string, safe_points) for the largest span. `end` is None
+        when the span is truncated; `stack` and `in_string` then describe the open state, and
+        `safe_points` lists (cut_index, open_stack) positions where a complete value ended.
+    """
+    best = None
+    start = None
+    stack = []
+    quote = None
+    escape = False
+    safe_points = []
+
+    for i, ch in enumerate(text):
+        if not stack:
+            if ch in "{[":
+                start, stack, safe_points = i, [ch], []
+            continue
+        if quote:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == quote:
+                quote = None
+            continue
+        if ch in "\"'":
+            quote = ch
+        elif ch in "{[":
+            stack.append(ch)
+        elif ch in "}]":
+            stack.pop()
+            if not stack:
+                if best is None or i + 1 - start > best[1] - best[0]:
+                    best = (start, i + 1, [], None, [])
+            else:
+                safe_points.append((i + 1, list(stack)))
+        elif ch == ",":
+            safe_points.append((i, list(stack)))
+
+    if stack and (best is None or len(text) - start > best[1] - best[0]):
+        return start, None, stack, quote, safe_points
+    return best
+
+
+def _normalize(fragment):
+    """
+    Rewrite a JSON-ish fragment as strict JSON: single-quoted strings become double-quoted,
+    Python literals become JSON literals and trailing commas are dropped.
+    """
+    out = []
+    i = 0
+    n = len(fragment)
+    while i < n:
+        ch = fragment[i]
+        if ch in "\"'":
+            quote = ch
+            buf = ['"']
+            i += 1
+            while i < n and fragment[i] != quote:
+                c = fragment[i]
+                if c == "\\" and i + 1 < n:
+                    nxt = fragment[i + 1]
+                    buf.append("'" if nxt == "'" else c + nxt)
+                    i += 2
+                    continue
+                if c == '"':
+                    buf.append('\\"')
+                elif c == "\n":
+                    buf.append("\\n")
+                else:
+                    buf.append(c)
+                i += 1
+            buf.append('"')
+            out.append("".join(buf))
+            i += 1
+            continue
+        if ch in "}]":
+            # Drop a trailing comma before the closer
+            j = len(out) - 1
+            while j >= 0 and out[j].isspace():
+                j -= 1
+            if j >= 0 and out[j] == ",":
+                del out[j]
+            out.append(ch)
+        elif ch.isalpha():
+            j = i
+            while j < n and (fragment[j].isalnum() or fragment[j] == "_"):
+                j += 1
+            word = fragment[i:j]
+            out.append(_PY_LITERALS.get(word, word))
+            i = j
+            continue
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _close(fragment, stack, quote=None):
+    fragment = fragment.rstrip()
+    if quote:
+        fragment += quote
+    fragment = re.sub(r"[,:]\s*$", "", fragment)
+    return fragment + "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+
+def _try_load(fragment):
+    try:
+        return json.loads(_normalize(fragment))
+    except (json.JSONDecodeError, RecursionError):
+        pass
+    try:
+        return ast.literal_eval(fragment)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def extract_json(text, max_repairs=3):
+    """
+    Salvage the largest JSON object or array from an LLM response.
+
+    Handles markdown fences, prose before/after the payload, single quotes, Python
+    literals (True/False/None), trailing commas and output truncated mid-value.
+
+    Args:
+        text (str): Raw LLM output
+        max_repairs (int): How many earlier cut points to try for truncated output
+
+    Raises:
+        LLMJSONDecodeError: If nothing parseable was found
+    """
+    if not isinstance(text, str):
+        text = str(text)
+    stripped = text.strip()
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError:
+        pass
+
+    fenced = _FENCE_RE.search(stripped)
+    if fenced:
+        stripped = fenced.group(1).strip() or stripped
+
+    span = _scan(stripped)
+    if span is None:
+        raise LLMJSONDecodeError("No JSON object or array found in LLM output")
+    start, end, stack, quote, safe_points = span
+
+    if end is not None:
+        parsed = _try_load(stripped[start:end])
+        if parsed is not None:
+            return parsed
+        raise LLMJSONDecodeError("Could not repair JSON in LLM output")
+
+    # Truncated output: close what is open, then fall back to earlier complete values.
+    candidates = [_close(stripped[start:], stack, quote)]
+    for cut, open_stack in reversed(safe_points[-max_repairs:]):
+        candidates.append(_close(stripped[start:cut], open_stack))
+    for candidate in candidates:
+        parsed = _try_load(candidate)
+        if parsed is not None:
+            return parsed
+    raise LLMJSONDecodeError("Could not repair truncated JSON in LLM output")
+
+
+def validate_schema(data, schema):
+    """
+    Check decoded data against a TASK_SCHEMAS entry, returning the (possibly trimmed) data.
+
+    A list schema also accepts a dict wrapping a single list (e.g. {"jobs": [...]}), and
+    drops list items that miss required keys.
+
+    Raises:
+        LLMJSONDecodeError: If the data does not match the schema
+    """
+    expected = schema.get("type")
+    if expected is list and isinstance(data, dict):
+        lists = [value for value in data.values() if isinstance(value, list)]
+        if len(lists) == 1:
+            data = lists[0]
+    if expected is not None and not isinstance(data, expected):
+        raise LLMJSONDecodeError(f"Expected a JSON {expected.__name__}, got {type(data).__name__}")
+
+    if isinstance(data, list) and schema.get("required"):
+        data = [
+            item for item in data
+            if isinstance(item, dict) and all(key in item for key in schema["required"])
+        ]
+        if not data:
+            raise LLMJSONDecodeError(f"No items with required keys {schema['required']}")
+    if isinstance(data, dict) and schema.get("any_of"):
+        if not any(key in data for key in schema["any_of"]):
+            raise LLMJSONDecodeError(f"Expected at least one of {schema['any_of']}")
+    return data
+
+
+def decode_llm_json(text, task=None):
+    """
+    Decode an LLM response into JSON and, if `task` names a TASK_SCHEMAS entry, validate it.
+
+    Raises:
+        LLMJSONDecodeError: If no valid JSON could be salvaged
+    """
+    data = extract_json(text)
+    if task is not None:
+        data = validate_schema(data, TASK_SCHEMAS[task])
+    return data
@@ -0,0 +1,136 @@
+import ast
+import json
+from utils.json_decoder import extract_json, LLMJSONDecodeError
+
+
+class IncrementalJSONAssembler:
+    """
+    Incrementally scan a streamed JSON object and emit each top-level key as soon as its value closes.
+
+    Text before the opening brace (e.g. a ```json fence or "Here is the [JSON] output:") and
+    after the closing brace is ignored; brackets are only counted from the first top-level `{`.
+    Every character is scanned exactly once, so feeding N chunks costs O(total length).
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.result = {}
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = True
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+
+    def feed(self, chunk):
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk (str): Next piece of the LLM output
+
+        Returns:
+            list[tuple]: (key, value) pairs completed by this chunk
+        """
+        completed = []
+        if self.done or not chunk:
+            return completed
+
+        self.buffer += chunk
+        buf = self.buffer
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if self._depth == 0:
+                # Prose before the object: quotes and brackets here are not JSON
+                if ch == "{":
+                    self._depth = 1
+                i += 1
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect_key and self._key_start is not None:
+                        self._key = json.loads(buf[self._key_start:i + 1])
+                        self._key_start = None
+            elif ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_start = i
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close_value(i, completed)
+                    if not self.result:
+                        # An empty "{}" in the prose; keep looking for the real object
+                        i += 1
+                        continue
+                    self.done = True
+                    i += 1
+                    break
+            elif self._depth == 1:
+                if ch == ":" and self._expect_key:
+                    self._expect_key = False
+                    self._value_start = i + 1
+                elif ch == ",":
+                    self._close_value(i, completed)
+            i += 1
+
+        self._pos = i
+        return completed
+
+    def _close_value(self, end, completed):
+        if self._key is not None and self._value_start is not None:
+            raw = self.buffer[self._value_start:end].strip()
+            if raw:
+                value = _loads_value(raw)
+                self.result[self._key] = value
+                completed.append((self._key, value))
+        self._key = None
+        self._value_start = None
+        self._expect_key = True
+
+    def finish(self, required=()):
+        """
+        Return the assembled object once the stream ends.
+
+        Falls back to parsing the whole buffer when the incremental scan never saw
+        a complete object, or saw one without all `required` keys (e.g. single-quoted
+        pseudo-JSON or output cut off mid-object). Keys already assembled are kept.
+
+        Args:
+            required (iterable): Top-level keys the object is expected to have
+
+        Raises:
+            ValueError: If nothing could be parsed from the stream
+        """
+        if self.done and self.result and all(key in self.result for key in required):
+            return self.result
+        try:
+            parsed = extract_json(self.buffer)
+        except LLMJSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict):
+            self.result = dict(parsed, **self.result)
+        elif not self.result:
+            raise ValueError("No JSON object found in streamed output")
+        return self.result
+
+
+def _loads_value(raw):
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        try:
+            return ast.literal_eval(raw)
+        except (ValueError, SyntaxError):
+            return raw
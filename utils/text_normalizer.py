@@ -0,0 +1,152 @@
+import re
+import json
+import math
+from collections import Counter
+
+PAGE_BREAK = "\f"
+FURNITURE_EDGE_LINES = 3
+
+_HYPHENATED_BREAK = re.compile(r"([A-Za-z]+)-\n[ \t]*([a-z]+)")
+_INLINE_WHITESPACE = re.compile(r"[ \t\u00a0\u2000-\u200b]+")
+_EXTRA_BLANK_LINES = re.compile(r"\n{3,}")
+_PAGE_NUMBER_LINE = re.compile(r"^(?:page\s*)?[-–]?\s*\d{1,3}\s*(?:(?:of|/)\s*\d{1,3})?\s*[-–]?$", re.IGNORECASE)
+_WORD = re.compile(r"[A-Za-z]+")
+# Word endings that are never words on their own, so "develop-\nment" is a split word
+_SPLIT_SUFFIXES = {
+    "ment", "ments", "tion", "tions", "sion", "sions", "ation", "ations", "ing", "ings", "ed", "ly",
+    "ness", "able", "ible", "ity", "ities", "ance", "ence", "ship", "ive", "ives", "ively", "al", "ally",
+    "ous", "ure", "ures", "ize", "ized", "izing", "ise", "ised", "ising", "ist", "ists", "ism",
+}
+
+
+def estimate_tokens(text):
+    """
+    Roughly estimate the number of LLM tokens in `text` (~4 characters per token for Gemini).
+    """
+    return math.ceil(len(text) / 4) if text else 0
+
+
+def _line_signature(line):
+    # Exact text only: masking digits would make different date lines ("2016 - 2019",
+    # "2014 - 2016") look like one repeated header.
+    return line.strip().lower()
+
+
+def _edge_indexes(lines):
+    """Indexes of the first and last non-blank lines of a page."""
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    return {filled[0], filled[-1]} if filled else set()
+
+
+def _strip_page_furniture(pages):
+    """
+    Drop repeats of lines found at the top/bottom of most pages (running headers/footers),
+    and page numbers on the first or last line of a page.
+    """
+    # Only the top and bottom lines of a page can be running headers/footers.
+    furniture = set()
+    if len(pages) >= 2:
+        page_counts = Counter()
+        for page in pages:
+            lines = [line for line in page.split("\n") if line.strip()]
+            edges = lines[:FURNITURE_EDGE_LINES] + lines[-FURNITURE_EDGE_LINES:]
+            page_counts.update({_line_signature(line) for line in edges})
+        threshold = max(2, math.ceil(len(pages) / 2))
+        furniture = {sig for sig, count in page_counts.items() if count >= threshold and len(sig) <= 120}
+
+    # Keep the first occurrence: on page one the "header" is often the candidate's name.
+    cleaned = []
+    seen = set()
+    for page in pages:
+        lines = page.split("\n")
+        edges = _edge_indexes(lines)
+        kept = []
+        for i, line in enumerate(lines):
+            # A bare number mid-page is content (e.g. years of experience), not a page number
+            if i in edges and _PAGE_NUMBER_LINE.match(line.strip()):
+                continue
+            signature = _line_signature(line)
+            if signature in furniture:
+                if signature in seen:
+                    continue
+                seen.add(signature)
+            kept.append(line)
+        cleaned.append("\n".join(kept))
+    return cleaned
+
+
+def _join_hyphenated(text):
+    """
+    Undo hyphenation at line breaks. The hyphen is dropped only when the joined word is
+    clearly one word split by the break (its tail is a suffix, or the joined form occurs
+    elsewhere in the text); compounds such as "self-\nmotivated" keep it.
+    """
+    words = {word.lower() for word in _WORD.findall(text)}
+
+    def join(match):
+        head, tail = match.group(1), match.group(2)
+        if tail in _SPLIT_SUFFIXES or (head + tail).lower() in words:
+            return head + tail
+        return f"{head}-{tail}"
+
+    return _HYPHENATED_BREAK.sub(join, text)
+
+
+def normalize_resume_text(text):
+    """
+    Clean extracted resume text before it is sent to the LLM.
+
+    - strips headers/footers repeated across pages (pages separated by form feeds) and page numbers
+    - joins words hyphenated across line breaks (compound words keep their hyphen)
+    - collapses runs of spaces/tabs and blank lines
+
+    Args:
+        text (str): Raw extracted text
+
+    Returns:
+        str: Normalized text
+    """
+    if not text:
+        return ""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    pages = _strip_page_furniture(text.split(PAGE_BREAK))
+    text = "\n".join(pages)
+    text = _join_hyphenated(text)
+    text = _INLINE_WHITESPACE.sub(" ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    text = _EXTRA_BLANK_LINES.sub("\n\n", text)
+    return text.strip()
+
+
+def minify_json(data):
+    """Serialize `data` as compact JSON (no indentation or padding)."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def compact_resume_text(text):
+    """
+    Normalize resume text (or re-minify it if it is JSON) and report the savings.
+
+    Args:
+        text (str): Resume content as read from the file
+
+    Returns:
+        tuple: (compacted_text, stats) where stats has chars/tokens before and after
+    """
+    stripped = text.strip() if text else ""
+    compacted = None
+    if stripped[:1] in ("{", "["):
+        try:
+            compacted = minify_json(json.loads(stripped))
+        except json.JSONDecodeError:
+            compacted = None
+    if compacted is None:
+        compacted = normalize_resume_text(text)
+
+    stats = {
+        "chars_before": len(text or ""),
+        "chars_after": len(compacted),
+        "tokens_before": estimate_tokens(text or ""),
+        "tokens_after": estimate_tokens(compacted),
+    }
+    return compacted, stats